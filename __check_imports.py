@@ -1,8 +1,15 @@
 mods = ['main','downloader','login','email_outlook','email_smtp','utils']
 import importlib, sys
+from importlib.util import find_spec
+
+# --deep importa de fato cada modulo (executa o codigo de nivel de modulo)
+deep = '--deep' in sys.argv[1:]
 for m in mods:
     try:
-        importlib.import_module(m)
-        print(m, 'OK')
+        if deep:
+            importlib.import_module(m)
+            print(m, 'OK')
+        else:
+            print(m, 'OK' if find_spec(m) else 'MISSING')
     except Exception as e:
         print(m, 'ERR', type(e).__name__, e)
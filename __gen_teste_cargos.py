@@ -1,5 +1,5 @@
 from pathlib import Path
-import pandas as pd
+from openpyxl import Workbook
 
 from docx_maker import gerar_docx_unificado, SessionMeta
 
@@ -38,8 +38,11 @@ def main():
 
     cols = ['Processo', 'Objeto', 'Relator', 'Revisor', 'Motivo']
     for d in dados:
-        df = pd.DataFrame([{k: d[k] for k in cols}])
-        df.to_excel(base / d['fname'], index=False)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(cols)
+        ws.append([d[k] for k in cols])
+        wb.save(base / d['fname'])
 
     # Gera o DOCX unificado a partir das planilhas de teste
     out_dir = Path('output'); out_dir.mkdir(exist_ok=True)
@@ -1,19 +1,26 @@
 # app.py
 from __future__ import annotations
 import argparse
+import csv
+import functools
+import multiprocessing
 import os
+import re
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
-from main import run_pipeline
-from pautas_consulta import run_consulta_pautas_pipeline
-from settings import ConfigError, env, get_etcm_config, load_env
+from settings import ConfigError, get_etcm_config, list_files, load_env
 
-# Envio via Outlook (pywin32)
-try:
-    from email_outlook import send_pauta_unificada, SendResult
-except Exception:
-    send_pauta_unificada = None  # type: ignore
-    SendResult = None            # type: ignore
+# main (playwright/pandas/python-docx), pautas_consulta e email_outlook (pywin32)
+# sao importados apenas no ramo que os utiliza.
+
+
+_DATE_BR_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+# Limite para --email-body-file (evita carregar um arquivo enorme como corpo do e-mail)
+_EMAIL_BODY_FILE_MAX_BYTES = 1 << 20
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
 
 
 def str2bool(v):
@@ -21,19 +28,22 @@ def str2bool(v):
         return v
     if v is None:
         return False
-    return str(v).strip().lower() in ("1", "true", "t", "yes", "y", "on")
+    return str(v).strip().casefold() in _TRUTHY
 
 
 def _find_first_existing(paths: list[Path]) -> Path | None:
+    # Um os.scandir por diretorio (em vez de um stat por candidato), mantendo a ordem de prioridade
+    listings: dict[Path, set[str]] = {}
     for p in paths:
-        try:
-            if p.exists():
-                return p
-        except Exception:
-            pass
+        parent = p.parent
+        if parent not in listings:
+            listings[parent] = list_files(parent)
+        if os.path.normcase(p.name) in listings[parent]:
+            return p
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _auto_header_default() -> str:
     env_val = os.getenv("TCM_HEADER_TEMPLATE", "").strip()
     script_dir = Path(__file__).resolve().parent
@@ -60,7 +70,22 @@ def _auto_header_default() -> str:
     return "papel_timbrado_tcm.docx"
 
 
+# Variaveis de ambiente usadas como default dos argumentos
+_ARG_ENV_KEYS = (
+    "ETCM_BASE_URL",
+    "BASE_URL",
+    "TCM_EMAIL_TO",
+    "TCM_EMAIL_CC",
+    "TCM_EMAIL_BCC",
+    "TCM_EMAIL_SUBJECT",
+    "TCM_EMAIL_BODY",
+    "TCM_EMAIL_ACCOUNT",
+)
+
+
 def parse_args():
+    # Snapshot unico (apos load_env) em vez de uma consulta ao ambiente por argumento
+    env_vals = {k: os.environ.get(k) or "" for k in _ARG_ENV_KEYS}
     p = argparse.ArgumentParser(
         description="Automação e-TCM: baixar planilhas, gerar PAUTA_UNIFICADA e (opcionalmente) enviar por Outlook."
     )
@@ -76,7 +101,7 @@ def parse_args():
     p.add_argument(
         "--base-url",
         type=str,
-        default=env("ETCM_BASE_URL", env("BASE_URL", "https://etcm.tcm.sp.gov.br")),
+        default=env_vals["ETCM_BASE_URL"] or env_vals["BASE_URL"] or "https://etcm.tcm.sp.gov.br",
         help="Base URL (padrão produção).",
     )
     p.add_argument("--sessao", type=str, default="71", help="Número da sessão (ex.: 71).")
@@ -103,7 +128,8 @@ def parse_args():
     p.add_argument("--dedupe", action="store_true", help="Tentar deduplicar linhas no XLSX consolidado.")
 
     # Documento
-    p.add_argument("--header-template", dest="header_template", default=_auto_header_default())
+    # Resolvido em main() apenas quando nao informado (evita sondar o disco a cada execucao)
+    p.add_argument("--header-template", dest="header_template", default=None)
     p.add_argument("--titulo-docx", dest="titulo_docx", default="Pauta Classificada")
     p.add_argument("--nome-docx", dest="nome_docx", default=None)
 
@@ -122,22 +148,61 @@ def parse_args():
     p.add_argument("--meta-horario", type=str, default="", help='Presencial: horário (padrão "9h30")')
 
     # E-mail (parametrizável por CLI/.env)
-    default_to = (env("TCM_EMAIL_TO", "") or "").strip()
+    default_to = env_vals["TCM_EMAIL_TO"].strip()
     p.add_argument("--send-email", action="store_true")
     p.add_argument("--email-preview", action="store_true")
     p.add_argument("--email-drafts", action="store_true")
     p.add_argument("--email-force-sync", action="store_true")
     p.add_argument("--email-to", type=str, default=default_to)
-    p.add_argument("--email-cc", type=str, default=env("TCM_EMAIL_CC", "") or "")
-    p.add_argument("--email-bcc", type=str, default=env("TCM_EMAIL_BCC", "") or "")
-    p.add_argument("--email-subject", type=str, default=env("TCM_EMAIL_SUBJECT", "") or "")
-    p.add_argument("--email-body", type=str, default=env("TCM_EMAIL_BODY", "") or "")
+    p.add_argument("--email-cc", type=str, default=env_vals["TCM_EMAIL_CC"])
+    p.add_argument("--email-bcc", type=str, default=env_vals["TCM_EMAIL_BCC"])
+    p.add_argument("--email-subject", type=str, default=env_vals["TCM_EMAIL_SUBJECT"])
+    p.add_argument("--email-body", type=str, default=env_vals["TCM_EMAIL_BODY"])
     p.add_argument("--email-body-file", type=str, default="")
-    p.add_argument("--email-account", type=str, default=env("TCM_EMAIL_ACCOUNT", "") or "")
+    p.add_argument(
+        "--email-batch",
+        type=str,
+        default="",
+        help="CSV com um envio por linha (colunas: to obrigatoria, cc, bcc, subject, body); reutiliza a mesma sessao do Outlook.",
+    )
+    p.add_argument("--email-account", type=str, default=env_vals["TCM_EMAIL_ACCOUNT"])
     p.add_argument("--email-verbose", action="store_true")
     return p.parse_args()
 
 
+def _read_email_batch(path: str) -> list[dict]:
+    """Le o CSV de --email-batch; campos vazios herdam os valores de --email-*."""
+    envios: list[dict] = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        if "to" not in (reader.fieldnames or []):
+            raise ValueError("cabecalho sem a coluna 'to'")
+        for row in reader:
+            envio = {k: (row.get(k) or "").strip() for k in ("to", "cc", "bcc", "subject", "body")}
+            envio = {k: v for k, v in envio.items() if v}
+            if envio.get("to"):
+                envios.append(envio)
+    return envios
+
+
+def _print_send_result(result) -> None:
+    print(f"[email] status={result.status} account={result.account or '-'}")
+    print(f"[email] recipients_resolved={result.recipients_resolved} entry_id={result.entry_id or '-'}")
+    print(f"[email] outbox_before={result.outbox_before} -> outbox_after={result.outbox_after}")
+    print(f"[email] sent_before={result.sent_before} -> sent_after={result.sent_after}")
+    print(f"[email] online_before={result.online_before} -> online_after={result.online_after}")
+    print(f"[email] anexado: {result.attachment}")
+    if result.log_path:
+        print(f"[email] log registrado em: {result.log_path}")
+    unresolved = [r for r in result.recipient_status if not r.resolved]
+    if unresolved:
+        print("[email][aviso] Destinatários não resolvidos:")
+        for item in unresolved:
+            who = item.original or item.display or item.address or "(desconhecido)"
+            reason = item.reason or "Motivo não informado."
+            print(f"  - {who}: {reason}")
+
+
 def _export_meta_to_env(args):
     """
     Se o usuário passar metadados da sessão (--meta-*), exporta para variáveis de ambiente
@@ -170,13 +235,14 @@ def _export_meta_to_env(args):
     if args.meta_data_encerramento:
         os.environ["TCM_META_ENCERRAMENTO_FINAL"] = args.meta_data_encerramento
     else:
+        m = _DATE_BR_RE.fullmatch(args.meta_data_abertura)
         try:
-            from datetime import datetime, timedelta
-            d = datetime.strptime(args.meta_data_abertura, "%d/%m/%Y")
+            d = datetime(int(m.group(3)), int(m.group(2)), int(m.group(1))) if m else None
+        except ValueError:
+            d = None
+        if d is not None:
             # 15 dias corridos, contando o dia inicial -> +16 dias no calendario
             os.environ["TCM_META_ENCERRAMENTO_FINAL"] = (d + timedelta(days=16)).strftime("%d/%m/%Y")
-        except Exception:
-            pass
 
 
 def main():
@@ -192,6 +258,7 @@ def main():
     if args.modo == "consulta-pautas":
         if args.send_email:
             raise SystemExit("Envio por Outlook disponivel apenas no modo sonp.")
+        from pautas_consulta import run_consulta_pautas_pipeline
 
         comp_list = [c.strip() for c in (args.competencias or "").split(",") if c.strip()]
         nome_consolidado = args.consolidado_nome or None
@@ -218,6 +285,16 @@ def main():
         )
         return
 
+    # Valida o lote antes do pipeline; com --email-batch nunca cai no envio para --email-to
+    envios: list[dict] = []
+    if args.send_email and args.email_batch:
+        try:
+            envios = _read_email_batch(args.email_batch)
+        except Exception as e:
+            raise SystemExit(f"Falha ao ler --email-batch: {e}")
+        if not envios:
+            raise SystemExit("--email-batch sem linhas com destinatario 'to'")
+
     # Injeta metadados (se informados) para o docx_maker
     _export_meta_to_env(args)
 
@@ -236,6 +313,9 @@ def main():
     comp_download = [c.strip() for c in (args.competencias_download or "").split(",") if c.strip()]
     pipeline_kwargs["competencias_download"] = comp_download or None
 
+    if args.header_template is None:
+        args.header_template = _auto_header_default()
+
     optional_kwargs = {}
     if args.header_template:
         optional_kwargs["header_template"] = args.header_template
@@ -245,6 +325,7 @@ def main():
         optional_kwargs["nome_docx"] = args.nome_docx
 
     # Executa pipeline (login -> download planilhas -> gera DOCX)
+    from main import run_pipeline
     try:
         run_pipeline(**pipeline_kwargs, **optional_kwargs)
     except TypeError:
@@ -253,20 +334,29 @@ def main():
 
     # Envio por Outlook (opcional)
     if args.send_email:
-        if not args.email_to:
+        if not args.email_to and not envios:
             raise SystemExit("Defina --email-to ou TCM_EMAIL_TO para envio.")
-        if send_pauta_unificada is None:
+        # Envio via Outlook (pywin32)
+        try:
+            from email_outlook import send_pauta_unificada, send_pauta_unificada_lote
+        except Exception:
             raise SystemExit("Envio indisponível. Confirme email_outlook.py e pywin32 instalado.")
 
         body_text = args.email_body
         if not body_text and args.email_body_file:
             try:
-                with open(args.email_body_file, "r", encoding="utf-8") as f:
-                    body_text = f.read()
+                with open(args.email_body_file, "r", encoding="utf-8", errors="replace") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size > _EMAIL_BODY_FILE_MAX_BYTES:
+                        # SystemExit nao e capturado pelo except abaixo: interrompe em vez de enviar sem corpo
+                        raise SystemExit(
+                            f"--email-body-file com {size} bytes excede o limite de {_EMAIL_BODY_FILE_MAX_BYTES} bytes"
+                        )
+                    body_text = f.read(_EMAIL_BODY_FILE_MAX_BYTES)
             except Exception as e:
                 print(f"[email] Falha ao ler --email-body-file: {e}", file=sys.stderr)
 
-        result = send_pauta_unificada(
+        envio_kwargs = dict(
             docx_path=None,
             output_dir=args.output_dir,
             sessao=str(args.sessao) if args.sessao else None,
@@ -281,22 +371,15 @@ def main():
             verbose=bool(args.email_verbose),
             force_sync=bool(args.email_force_sync),
         )
-        print(f"[email] status={result.status} account={result.account or '-'}")
-        print(f"[email] recipients_resolved={result.recipients_resolved} entry_id={result.entry_id or '-'}")
-        print(f"[email] outbox_before={result.outbox_before} -> outbox_after={result.outbox_after}")
-        print(f"[email] sent_before={result.sent_before} -> sent_after={result.sent_after}")
-        print(f"[email] online_before={result.online_before} -> online_after={result.online_after}")
-        print(f"[email] anexado: {result.attachment}")
-        if result.log_path:
-            print(f"[email] log registrado em: {result.log_path}")
-        unresolved = [r for r in result.recipient_status if not r.resolved]
-        if unresolved:
-            print("[email][aviso] Destinatários não resolvidos:")
-            for item in unresolved:
-                who = item.original or item.display or item.address or "(desconhecido)"
-                reason = item.reason or "Motivo não informado."
-                print(f"  - {who}: {reason}")
+        if envios:
+            results = send_pauta_unificada_lote(envios, **envio_kwargs)
+        else:
+            results = [send_pauta_unificada(**envio_kwargs)]
+        for result in results:
+            _print_send_result(result)
 
 
 if __name__ == "__main__":
+    # Necessario para os workers da leitura paralela (TCM_DOCX_WORKERS) num executavel congelado
+    multiprocessing.freeze_support()
     main()
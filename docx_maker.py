@@ -1,34 +1,73 @@
 from __future__ import annotations
 
+import io
+import os
 import re
+import sys
 import unicodedata
+import zipfile
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, List
 
 import pandas as pd
+
+try:
+    import python_calamine
+except ImportError:  # opcional: sem o calamine a leitura segue pelo openpyxl
+    python_calamine = None
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Pt, RGBColor
 from docx.opc.exceptions import PackageNotFoundError
+from docx.oxml import OxmlElement
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from settings import list_files
 
 
 # =========================
 # Utilidades bÃ¡sicas
 # =========================
 
+# Os helpers de normalizacao abaixo recebem os mesmos poucos nomes/rotulos milhares de vezes
+# por planilha; o cache evita refazer NFKD/regex para cada ocorrencia.
+_NORM_CACHE_SIZE = 4096
+
+
 def _ws(s) -> str:
     if s is None or (isinstance(s, float) and pd.isna(s)):
         return ""
-    return re.sub(r"\s+", " ", str(s)).strip()
+    return _ws_text(str(s))
+
+
+_WS_RE = re.compile(r"\s+")
+
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def _ws_text(s: str) -> str:
+    return _WS_RE.sub(" ", s).strip()
 
+
+def _ws_series(s: pd.Series) -> pd.Series:
+    """Aplica _ws a uma coluna inteira pelos acessores .str do pandas."""
+    return s.fillna("").astype(str).str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _strip_accents_lower(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    # ASCII puro nao muda no NFKD; so o lower basta
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
     return s.lower()
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _norm_relator_key(value: str) -> str:
     key = _strip_accents_lower(_ws(value))
     if "joao" in key and "antanio" in key:
@@ -36,15 +75,32 @@ def _norm_relator_key(value: str) -> str:
     return key
 
 
+def _map_distinct(values: pd.Series, fn) -> pd.Series:
+    """Aplica `fn` uma vez por valor distinto e espalha o resultado pela coluna."""
+    if values.empty:
+        return values
+    return values.map({v: fn(v) for v in values.unique()})
+
+
+def _relator_keys(relatores: pd.Series) -> pd.Series:
+    return _map_distinct(relatores, _norm_relator_key)
+
+
+_DATE_BR_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
 def _parse_date_br(s: str) -> datetime | None:
+    m = _DATE_BR_RE.fullmatch(s.strip())
+    if not m:
+        return None
     try:
-        return datetime.strptime(s.strip(), "%d/%m/%Y")
-    except Exception:
+        return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    except ValueError:
         return None
 
 
 def _fmt_date_br(d: datetime | date) -> str:
-    return (d if isinstance(d, datetime) else datetime.combine(d, datetime.min.time())).strftime("%d/%m/%Y")
+    return d.strftime("%d/%m/%Y")
 
 
 _MESES_PT = [
@@ -88,17 +144,22 @@ def _weekday_of_next_week(today: datetime, weekday: int) -> date:
     return monday_next + timedelta(days=weekday)
 
 
+_HORARIO_MIN_RE = re.compile(r"(?i)\s*min\.?\s*$")
+_TRAILING_DOT_RE = re.compile(r"\.\s*$")
+
+
 def _normalize_horario_text(value: str) -> str:
     """Normaliza horario presencial para o padrao curto (ex.: 9h30)."""
     raw = _ws(value)
     if not raw:
         return "9h30"
-    out = re.sub(r"(?i)\s*min\.?\s*$", "", raw)
-    out = re.sub(r"\.\s*$", "", out)
+    out = _HORARIO_MIN_RE.sub("", raw)
+    out = _TRAILING_DOT_RE.sub("", out)
     out = _ws(out)
     return out or "9h30"
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _cargo_conselheiro(nome: str) -> str:
     k = _strip_accents_lower(_ws(nome))
     if k == "domingos dissei":
@@ -110,6 +171,20 @@ def _cargo_conselheiro(nome: str) -> str:
     return "CONSELHEIRO"
 
 
+# Substring no cabecalho (minusculo) -> coluna; a primeira que casar decide, na ordem
+# processo > objeto > relator > revisor > motivo. As demais variantes antigas
+# ("nº do processo", "objeto de julgamento", "relator(a)", ...) ja contem estas.
+_COL_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("processo", "proc"),
+    ("nÂº do proc.", "proc"),
+    ("objeto", "obj"),
+    ("relator", "rel"),
+    ("conselheiro", "rel"),
+    ("revisor", "rev"),
+    ("motivo", "mot"),
+)
+
+
 def _detect_cols_basic(cols: List[str]) -> Tuple[int, int, Optional[int], Optional[int], Optional[int]]:
     """
     Retorna Ã­ndices (0-based): (proc_idx, obj_idx, relator_idx, revisor_idx, motivo_idx)
@@ -119,21 +194,18 @@ def _detect_cols_basic(cols: List[str]) -> Tuple[int, int, Optional[int], Option
         * Revisor  -> coluna 8 (index 7), se existir
         * Motivo   -> coluna 10 (index 9), se existir
     """
-    proc_idx, obj_idx = 1, 3
-    relator_idx, revisor_idx, motivo_idx = None, None, None
-
+    slots: dict[str, int] = {}
     for i, c in enumerate(cols):
         cl = c.lower()
-        if any(k in cl for k in ["processo", "nÂº do processo", "numero do processo", "n. do processo", "nÂº do proc."]):
-            proc_idx = i
-        elif any(k in cl for k in ["objeto", "objeto de julgamento"]):
-            obj_idx = i
-        elif any(k in cl for k in ["relator", "conselheiro", "relator(a)"]):
-            relator_idx = i
-        elif "revisor" in cl or "revisor(a)" in cl:
-            revisor_idx = i
-        elif "motivo" in cl:
-            motivo_idx = i
+        for k, slot in _COL_KEYWORDS:
+            if k in cl:
+                slots[slot] = i
+                break
+    proc_idx = slots.get("proc", 1)
+    obj_idx = slots.get("obj", 3)
+    relator_idx = slots.get("rel")
+    revisor_idx = slots.get("rev")
+    motivo_idx = slots.get("mot")
 
     n = len(cols)
     proc_idx = proc_idx if proc_idx < n else min(1, n - 1)
@@ -165,6 +237,15 @@ _DUO_RELATOR_REVISOR = {
     "domingos dissei": "ROBERTO BRAGUIM",
 }
 
+# Prioridade fixa de revisores dentro de cada relator (chaves ja normalizadas)
+# 1) Vice-Presidente Ricardo Torres; 2) Corregedor Roberto Braguim; 3) Jo?o Antonio; 4) Eduardo Tuma; demais depois.
+_REVISOR_ORDEM = {
+    "ricardo torres": 1,
+    "roberto braguim": 2,
+    "joao antonio": 3,
+    "eduardo tuma": 4,
+}
+
 
 _SUBSTITUTOS: set[str] = {
     "daniela farias",
@@ -189,93 +270,6 @@ def _is_feminino(nome: str) -> bool:
     return _norm_relator_key(nome) in _SUBSTITUTAS_FEMININAS
 
 
-# Palavras/expressÃµes-chave a destacar (em negrito) no campo "Objeto".
-_OBJ_HL_TERMS: list[str] = [
-    # A) Recurso; B) Diversos; C) Contratos
-    "Recurso",
-    "Diversos",
-    # Contratos - subtipos
-    "Nota de Empenho com Termo Aditivo",
-    "Nota de Empenho",
-    "AnÃ¡lise de LicitaÃ§Ã£o",
-    "Lei 8.666",
-    "Lei 14.133",
-    "Ordem de ExecuÃ§Ã£o de ServiÃ§o",
-    "ExecuÃ§Ã£o Contratual",
-    "Carta-Contrato",
-    "Contrato com Termo Aditivo",
-    "Carta-Contrato com Termo Aditivo",
-    "ConsÃ³rcio",
-    "Termo de CopatrocÃ­nio",
-    "ConvÃªnio com Termo Aditivo",
-    "ConvÃªnio com Termo de RescisÃ£o",
-    "ConvÃªnio",
-    "Termo de QuitaÃ§Ã£o",
-    "Termo de Recebimento Definitivo",
-    "Carta Aditiva",
-    "Termo Aditivo com Nota de Empenho",
-    "Termo Aditivo",
-    "Termo de ProrrogaÃ§Ã£o",
-    "Termo de Recebimento ProvisÃ³rio",
-    "Termo de RetirratificaÃ§Ã£o com valor",
-    "Termo de RetirratificaÃ§Ã£o sem valor",
-    "Termo de Compromisso e AutorizaÃ§Ã£o de Fornecimento",
-    "Termo de QuitaÃ§Ã£o de ObrigaÃ§Ãµes",
-    "Termo de RescisÃ£o",
-    "Termo Aditivo com ExecuÃ§Ã£o Contratual",
-    "AutorizaÃ§Ã£o de Fornecimento",
-    "Pedido de Compra",
-    "Acompanhamentos",
-    "Acompanhamento de edital",
-    "Acompanhamento de procedimento licitatÃ³rio",
-    "Acompanhamento - ExecuÃ§Ã£o Contratual",
-    "Acompanhamento - ExecuÃ§Ã£o ContÃ¡bil e Financeira",
-    "- Acompanhamento - ExecuÃ§Ã£o ContÃ¡bil e Financeira",
-    # D) E) F)
-    "Contratos de EmergÃªncia",
-    "Lei Municipal 11.100/91",
-    "SubvenÃ§Ãµes",
-    "AuxÃ­lios",
-    "ReinclusÃµes",
-]
-
-
-def _norm_term_label(term: str) -> str:
-    t = _strip_accents_lower(_ws(term))
-    t = t.replace("-", "-")
-    t = re.sub(r"^[\s\-]+", "", t)
-    t = re.sub(r"\s+", " ", t)
-    return t
-
-
-def _compile_keyword_patterns() -> list[tuple[str, re.Pattern]]:
-    patterns: list[tuple[str, re.Pattern]] = []
-    # Classe de hÃ­fens/traÃ§os Unicode comum: ASCII '-' e U+2010..U+2015
-    hy = r"[-\u2010-\u2015]"
-    for term in sorted(_OBJ_HL_TERMS, key=len, reverse=True):  # prioriza termos mais longos
-        # ConstrÃ³i regex tolerante a espaÃ§os mÃºltiplos e variaÃ§Ã£o de hÃ­fens
-        esc = re.escape(term)
-        esc = esc.replace(r"\ ", r"\s+")
-        # Normaliza hÃ­fens/traÃ§os para classe comum
-        esc = esc.replace(r"\-", hy)  # hÃ­fen ASCII escapado
-        esc = esc.replace("\u2010", hy)  # HYPHEN (se escapar como literal)
-        esc = esc.replace("\u2011", hy)  # NON-BREAKING HYPHEN
-        esc = esc.replace("\u2012", hy)  # FIGURE DASH
-        esc = esc.replace("\u2013", hy)  # EN DASH
-        esc = esc.replace("\u2014", hy)  # EM DASH
-        esc = esc.replace("\u2015", hy)  # HORIZONTAL BAR
-        # aceita variaÃ§Ãµes de ':' com ou sem espaÃ§o
-        esc = esc.replace(r"\:\ ", r":?\s*")
-        try:
-            pat = re.compile(esc, flags=re.IGNORECASE)
-            patterns.append((_norm_term_label(term), pat))
-        except re.error:
-            patterns.append((_norm_term_label(term), re.compile(re.escape(term), flags=re.IGNORECASE)))
-    return patterns
-
-
-_OBJ_HL_PATTERNS = _compile_keyword_patterns()
-
 # Palavras/expressÃµes-chave da 1Âª pÃ¡gina (ordem de prioridade).
 KEYWORDS_ORDERED: list[str] = [
     "Embargo de DeclaraÃ§Ã£o",
@@ -316,41 +310,34 @@ KEYWORDS_ORDERED: list[str] = [
 ]
 
 
-_CP1252_CHAR_TO_BYTE: dict[str, int] = {}
-for _i in range(256):
-    try:
-        _ch = bytes([_i]).decode("cp1252")
-    except UnicodeDecodeError:
-        _ch = bytes([_i]).decode("latin-1")
-    _CP1252_CHAR_TO_BYTE[_ch] = _i
+# Caractere cp1252 de cada byte (bytes indefinidos no cp1252 caem no latin-1), numa unica decodificacao.
+_CP1252_CHARS = "".join(
+    chr(i) if c == "\ufffd" else c
+    for i, c in enumerate(bytes(range(256)).decode("cp1252", errors="replace"))
+)
+# Pares "Ã?"/"Â?" (UTF-8 de 2 bytes lido como cp1252) -> caractere original, montados uma unica vez.
+_MOJIBAKE_PAIRS: dict[str, str] = {
+    lead_ch + _CP1252_CHARS[byte]: bytes([lead, byte]).decode("utf-8")
+    for lead, lead_ch in ((0xC3, "Ã"), (0xC2, "Â"))
+    for byte in range(0x80, 0xC0)
+}
+_MOJIBAKE_PAIR_RE = re.compile(
+    "[ÃÂ][" + re.escape(_CP1252_CHARS[0x80:0xC0]) + "]"
+)
+_C1_CONTROL_RE = re.compile(r"[\x80-\x9f]")
 
 
 def _repair_mojibake_pairs(text: str) -> str:
-    out: list[str] = []
-    i = 0
-    n = len(text)
-    while i < n:
-        ch = text[i]
-        if ch in ("Ã", "Â") and i + 1 < n:
-            nxt = text[i + 1]
-            byte = _CP1252_CHAR_TO_BYTE.get(nxt)
-            lead = 0xC3 if ch == "Ã" else 0xC2
-            if byte is not None and 0x80 <= byte <= 0xBF:
-                try:
-                    out.append(bytes([lead, byte]).decode("utf-8"))
-                    i += 2
-                    continue
-                except UnicodeDecodeError:
-                    pass
-        out.append(ch)
-        i += 1
-    return "".join(out)
+    if "Ã" not in text and "Â" not in text:
+        return text
+    return _MOJIBAKE_PAIR_RE.sub(lambda m: _MOJIBAKE_PAIRS[m.group()], text)
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _fix_mojibake(text: str) -> str:
     out = text
     # Corrige sequencias UTF-8 decodificadas como Latin-1 (bytes 0x80..0x9F viram controles).
-    if any(0x80 <= ord(c) <= 0x9F for c in out):
+    if _C1_CONTROL_RE.search(out):
         try:
             out = out.encode("latin-1").decode("utf-8")
         except UnicodeError:
@@ -366,15 +353,21 @@ def _fix_mojibake(text: str) -> str:
 KEYWORDS_ORDERED = [_fix_mojibake(k) for k in KEYWORDS_ORDERED]
 
 _CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+# Mesmo conjunto do _CTRL_CHARS_RE, para remocao via str.translate
+_CTRL_TRANSLATE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)])
 
 
 def _clean_docx_text(text: str) -> str:
     if not text:
         return ""
     out = text
-    if _CTRL_CHARS_RE.search(out) or "Ã" in out or "Â" in out or "�" in out:
+    has_ctrl = _CTRL_CHARS_RE.search(out) is not None
+    if has_ctrl or "Ã" in out or "Â" in out or "�" in out:
         out = _fix_mojibake(out)
-    out = _CTRL_CHARS_RE.sub("", out)
+        # o reparo pode gerar controles C1 (ex.: "Â€" -> U+0080)
+        has_ctrl = _CTRL_CHARS_RE.search(out) is not None
+    if has_ctrl:
+        out = out.translate(_CTRL_TRANSLATE)
     return out
 
 
@@ -404,6 +397,17 @@ _VALOR_INSTRUMENTO_RE = re.compile(r"\(?\s*valor do instrumento[^)]*\)?", flags=
 _EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
 _SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:])")
 _EX_OFFICIO_RE = re.compile(r"(?<![\"“”])\bEx\s+officio\b(?![\"“”])", flags=re.IGNORECASE)
+_DOT_DOT_RE = re.compile(r"\.\s*\.")
+_TRAMITA_CONJUNTO_COM_RE = re.compile(r"Tramita\s+em\s+conjunto\s+com\s+os?\s+TCs?\s+", flags=re.IGNORECASE)
+# Excecoes pontuais (74ª SONP)
+_CE_SPCS_5107_RE = re.compile(r"Contrato Emergencial\s+0?25/SPCS/2016", flags=re.IGNORECASE)
+_CE_SPCS_5116_RE = re.compile(r"Contrato Emergencial\s+0?2?5/SPCS/2016\s*,?", flags=re.IGNORECASE)
+_VALOR_EM_DATA_RE = re.compile(r"no valor de\s+R\$\s*[\d\.,]+\s+em\s+09/12/2015", flags=re.IGNORECASE)
+_VALOR_VAZIO_EM_DATA_RE = re.compile(r"no valor de\s+em\s+09/12/2015", flags=re.IGNORECASE)
+
+
+_PROC_NUM_YEAR_RE = re.compile(r"(\d{1,7})\s*/\s*(\d{4})")
+_RETIRADO_ANTES_RETORNO_RE = re.compile(r"Retirado de Pauta.*?(?=Retorno à pauta)", flags=re.IGNORECASE)
 
 
 def _normalize_tc_id(value: str) -> str | None:
@@ -412,16 +416,20 @@ def _normalize_tc_id(value: str) -> str | None:
     m = _TC_ID_RE.search(value)
     if not m:
         return None
-    num = re.sub(r"\D", "", m.group(1))
-    year = m.group(2)
+    return _tc_id_from_match(m)
+
+
+def _tc_id_from_match(m: re.Match) -> str | None:
+    # O grupo do numero so contem digitos ASCII e pontos
+    num = m.group(1).replace(".", "")
     if not num:
         return None
-    return f"TC/{num.zfill(6)}/{year}"
+    return f"TC/{num.zfill(6)}/{m.group(2)}"
 
 
 def _process_year_num(value: str) -> tuple[int, int]:
     norm = _normalize_tc_id(value) or _ws(value)
-    m = re.search(r"(\d{1,7})\s*/\s*(\d{4})", norm)
+    m = _PROC_NUM_YEAR_RE.search(norm)
     if not m:
         return (9999, 0)
     try:
@@ -435,7 +443,7 @@ def _extract_tramitam_group(texto: str) -> list[str]:
         return []
     out = []
     for m in _TC_ID_RE.finditer(texto):
-        norm = _normalize_tc_id(m.group(0))
+        norm = _tc_id_from_match(m)
         if norm and norm not in out:
             out.append(norm)
     return out
@@ -445,19 +453,22 @@ def _sanitize_objeto_text(texto: str) -> str:
     if not texto:
         return ""
     out = _clean_docx_text(texto)
-    out = _X000D_RE.sub(" ", out)
-    out = _VALOR_RE.sub("", out)
-    out = _VALOR_SOLTO_RE.sub("", out)
-    out = _CONS_SIGLAS_PARENS_RE.sub("", out)
-    out = _CONS_SIGLAS_COMBO_RE.sub("", out)
+    # As remocoes precisam ser sequenciais (uma pode juntar texto que a seguinte remove);
+    # os literais obrigatorios de cada padrao permitem pular as passadas que nao casariam.
+    if "000" in out:
+        out = _X000D_RE.sub(" ", out)
+    if "$" in out:
+        out = _VALOR_RE.sub("", out)
+        out = _VALOR_SOLTO_RE.sub("", out)
+    has_parens = "(" in out and ")" in out
+    if has_parens:
+        out = _CONS_SIGLAS_PARENS_RE.sub("", out)
+    if "/" in out:
+        out = _CONS_SIGLAS_COMBO_RE.sub("", out)
     out = _CONS_SIGLAS_TOKEN_RE.sub("", out)
-    out = _PESQUISADO_RE.sub("", out)
-    out = re.sub(
-        r"Tramita\s+em\s+conjunto\s+com\s+os?\s+TCs?\s+",
-        "Tramitam em conjunto os TCs ",
-        out,
-        flags=re.IGNORECASE,
-    )
+    if has_parens:
+        out = _PESQUISADO_RE.sub("", out)
+    out = _TRAMITA_CONJUNTO_COM_RE.sub("Tramitam em conjunto os TCs ", out)
     out = out.replace(" ? peça", " - peça").replace("? peça", " - peça")
     out = _VERIFICADO_RE.sub("", out)
     out = _ws(out)
@@ -470,7 +481,7 @@ def normalize_status_lines(text: str) -> str:
         return ""
     out = text
     if _RETORNO_PAUTA_RE.search(out):
-        out = re.sub(r"Retirado de Pauta.*?(?=Retorno à pauta)", "", out, flags=re.IGNORECASE)
+        out = _RETIRADO_ANTES_RETORNO_RE.sub("", out)
         out = _RETIRADO_PAUTA_RE.sub("", out)
     return _ws(out)
 
@@ -480,34 +491,29 @@ def sanitize_text(text: str) -> str:
     if not text:
         return ""
     out = _VALOR_INSTRUMENTO_RE.sub("", text)
-    out = _EMPTY_PARENS_RE.sub("", out)
+    if "(" in out:
+        out = _EMPTY_PARENS_RE.sub("", out)
     out = _EX_OFFICIO_RE.sub(lambda m: f"\"{m.group(0)}\"", out)
     out = out.replace(")..", ").")
     out = out.replace(").-", "). -")
-    out = re.sub(r"\.\s*\.", ".", out)
+    out = _DOT_DOT_RE.sub(".", out)
     out = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", out)
     return _ws(out)
 
 
+_PUBLISHED_EXCEPTION_PROCS = frozenset({"TC/005107/2016", "TC/005116/2016", "TC/009301/2022"})
+_FINAL_OVERRIDE_PROCS = frozenset({"TC/007543/1999"})
+
+
 def apply_published_exceptions(proc_norm: str, text: str) -> str:
     """Exceções pontuais para aderência ao padrão publicado da 74ª SONP."""
     if not text:
         return ""
     out = text
     if proc_norm == "TC/005107/2016":
-        out = re.sub(
-            r"Contrato Emergencial\s+0?25/SPCS/2016",
-            "Contrato Emergencial 25/SPCS/2016",
-            out,
-            flags=re.IGNORECASE,
-        )
+        out = _CE_SPCS_5107_RE.sub("Contrato Emergencial 25/SPCS/2016", out)
     elif proc_norm == "TC/005116/2016":
-        out = re.sub(
-            r"Contrato Emergencial\s+0?2?5/SPCS/2016\s*,?",
-            "Contrato Emergencial 25/SPCS/2016",
-            out,
-            flags=re.IGNORECASE,
-        )
+        out = _CE_SPCS_5116_RE.sub("Contrato Emergencial 25/SPCS/2016", out)
         out = _VALOR_RE.sub("", out)
         out = _VALOR_SOLTO_RE.sub("", out)
     elif proc_norm == "TC/009301/2022":
@@ -522,18 +528,8 @@ def apply_final_overrides(proc_norm: str, text: str) -> str:
         return ""
     out = text
     if proc_norm == "TC/007543/1999":
-        out = re.sub(
-            r"no valor de\s+R\$\s*[\d\.,]+\s+em\s+09/12/2015",
-            "no valor de R$ 5.997.776,30 em 09/12/2015",
-            out,
-            flags=re.IGNORECASE,
-        )
-        out = re.sub(
-            r"no valor de\s+em\s+09/12/2015",
-            "no valor de R$ 5.997.776,30 em 09/12/2015",
-            out,
-            flags=re.IGNORECASE,
-        )
+        out = _VALOR_EM_DATA_RE.sub("no valor de R$ 5.997.776,30 em 09/12/2015", out)
+        out = _VALOR_VAZIO_EM_DATA_RE.sub("no valor de R$ 5.997.776,30 em 09/12/2015", out)
     return _ws(out)
 
 
@@ -608,11 +604,22 @@ _CONJUNTO_RULES = {
     },
 }
 
+# Indice reverso processo -> regras que o citam; a posicao preserva a ordem de aplicacao.
+_CONJUNTO_ORDER = {key: i for i, key in enumerate(_CONJUNTO_RULES)}
+_PROC_TO_CONJUNTO_KEYS: dict[str, list[frozenset[str]]] = {}
+for _key in _CONJUNTO_RULES:
+    for _proc in _key:
+        _PROC_TO_CONJUNTO_KEYS.setdefault(_proc, []).append(_key)
+
 
+_PARENS_RE = re.compile(r"[()]")
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _norm_keyword_label(term: str) -> str:
     t = _strip_accents_lower(_ws(term))
-    t = re.sub(r"[()]", "", t)
-    t = re.sub(r"\s+", " ", t)
+    t = _PARENS_RE.sub("", t)
+    t = _WS_RE.sub(" ", t)
     return t.strip()
 
 
@@ -652,6 +659,45 @@ def _compile_primary_keyword_patterns() -> list[tuple[str, re.Pattern]]:
 
 _PRIMARY_KEYWORD_PATTERNS = _compile_primary_keyword_patterns()
 
+
+def _keyword_trie_regex(terms: list[str]) -> str:
+    """Monta uma alternancia em trie (prefixos comuns fatorados) equivalente a uniao de _build_keyword_pattern."""
+
+    def atom(ch: str) -> str:
+        if ch == " ":
+            return r"\s+"
+        if ch == "-":
+            return fr"\s*{_HYPHEN_CLASS}\s*"
+        return re.escape(ch.lower())
+
+    def emit(node: dict) -> str:
+        alts = [a + emit(child) for a, child in node.items() if a]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    root: dict = {}
+    especiais: list[str] = []
+    for term in terms:
+        if _strip_accents_lower(_ws(term)) in {"ta", "tas"}:
+            especiais.append(_build_keyword_pattern(term).pattern)
+            continue
+        node = root
+        for ch in term:
+            node = node.setdefault(atom(ch), {})
+        node[""] = {}
+    return "|".join([emit(root)] + especiais)
+
+
+# Uniao de todos os termos: uma unica varredura acha a posicao mais a esquerda em que algum termo casa.
+_PRIMARY_KEYWORD_ANY_RE = re.compile(_keyword_trie_regex(_PRIMARY_KEYWORDS), flags=re.IGNORECASE)
+
+# Padroes agrupados pela inicial (minuscula) do termo, preservando a ordem de prioridade.
+_PRIMARY_KEYWORD_BY_INITIAL: dict[str, list[tuple[str, re.Pattern]]] = {}
+for _label, _pat in _PRIMARY_KEYWORD_PATTERNS:
+    _PRIMARY_KEYWORD_BY_INITIAL.setdefault(_label[:1].lower(), []).append((_label, _pat))
+
 _GROUP_RANKS = {
     "embargo de declaracao": 1,
     "embargos de declaracao": 1,
@@ -671,21 +717,22 @@ _ITENS_ENGLOBADOS_PATTERN = re.compile(
     fr"itens\s+englobados\s*(?:{_HYPHEN_CLASS}|:)\s*{_ITEM_TOKEN}\s*(?:e|a)\s*{_ITEM_TOKEN}",
     flags=re.IGNORECASE,
 )
+_ITENS_ENGLOBADOS_FULL_RE = re.compile(
+    fr"itens\s+englobados\s*({_HYPHEN_CLASS}|:)\s*({_ITEM_TOKEN})\s*(?:e|a)\s*({_ITEM_TOKEN})",
+    flags=re.IGNORECASE,
+)
+_HYPHEN_RE = re.compile(_HYPHEN_CLASS)
 
 
 def _extract_itens_englobados(texto: str) -> tuple[list[str], str]:
     if not texto:
         return [], ": "
     cleaned = _clean_docx_text(texto)
-    m = re.search(
-        fr"itens\s+englobados\s*({_HYPHEN_CLASS}|:)\s*({_ITEM_TOKEN})\s*(?:e|a)\s*({_ITEM_TOKEN})",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    m = _ITENS_ENGLOBADOS_FULL_RE.search(cleaned)
     if not m:
         return [], ": "
     sep_raw = m.group(1) or ":"
-    sep = " - " if re.search(_HYPHEN_CLASS, sep_raw) else ": "
+    sep = " - " if _HYPHEN_RE.search(sep_raw) else ": "
     items = [m.group(2), m.group(3)]
     return items, sep
 
@@ -696,29 +743,33 @@ def _keyword_group_rank(keyword: str | None) -> int:
     return _GROUP_RANKS.get(_norm_keyword_label(keyword), 4)
 
 
-def compute_primary_keyword(text: str) -> tuple[str | None, int, tuple[int, int] | None]:
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
+def compute_primary_keyword(
+    text: str, already_clean: bool = False
+) -> tuple[str | None, int, tuple[int, int] | None]:
+    # already_clean: o chamador ja passou o texto por _clean_docx_text (os spans valem para ele)
     if not text:
         return None, SEM_CATEGORIA_RANK, None
-    text = _clean_docx_text(text)
+    if not already_clean:
+        text = _clean_docx_text(text)
+    first = _PRIMARY_KEYWORD_ANY_RE.search(text)
+    if not first:
+        return None, SEM_CATEGORIA_RANK, None
+    # Desempate na posicao encontrada: match mais longo; em empate, o termo de maior prioridade.
+    pos = first.start()
     best_label = None
     best_span = None
     best_len = -1
-    best_pos = None
-    best_idx = None
-    for idx, (label, pat) in enumerate(_PRIMARY_KEYWORD_PATTERNS):
-        m = pat.search(text)
-        if not m:
-            continue
-        s, e = m.start(), m.end()
-        if best_pos is None or s < best_pos:
-            best_label, best_span, best_len, best_pos, best_idx = label, (s, e), e - s, s, idx
-            continue
-        if s == best_pos:
-            span_len = e - s
-            if span_len > best_len:
-                best_label, best_span, best_len, best_pos, best_idx = label, (s, e), span_len, s, idx
-            elif span_len == best_len and best_idx is not None and idx < best_idx:
-                best_label, best_span, best_len, best_pos, best_idx = label, (s, e), span_len, s, idx
+    # So os termos com a mesma inicial podem casar em pos; se a inicial nao bater com
+    # nenhum grupo (variacoes de caixa Unicode), testa todos.
+    candidatos = _PRIMARY_KEYWORD_BY_INITIAL.get(text[pos].lower(), ())
+    for pats in (candidatos, _PRIMARY_KEYWORD_PATTERNS):
+        for label, pat in pats:
+            m = pat.match(text, pos)
+            if m and m.end() - pos > best_len:
+                best_label, best_span, best_len = label, (pos, m.end()), m.end() - pos
+        if best_label:
+            break
     if best_label:
         return best_label, _keyword_group_rank(best_label), best_span
     return None, SEM_CATEGORIA_RANK, None
@@ -727,27 +778,24 @@ def compute_primary_keyword(text: str) -> tuple[str | None, int, tuple[int, int]
 def sort_items_for_segment(items: pd.DataFrame, process_priority: dict[str, int] | None = None) -> pd.DataFrame:
     if items.empty:
         return items
-    ranks = items["Objeto"].map(lambda t: compute_primary_keyword(_ws(t))[1])
-    year_num = items["Processo"].map(_process_year_num)
-    years = year_num.map(lambda t: t[0])
-    nums = year_num.map(lambda t: t[1])
+    # So o rank do grupo importa aqui; compute_primary_keyword e memoizado, entao objetos
+    # repetidos entre segmentos (e no destaque em _split_objeto_runs) nao sao reprocessados.
+    ranks = [compute_primary_keyword(_ws(t))[1] for t in items["Objeto"]]
+    processos = items["Processo"].tolist()
+    years, nums = zip(*map(_process_year_num, processos))
     if process_priority:
-        priorities = items["Processo"].map(
-            lambda p: process_priority.get(_normalize_tc_id(_ws(p)) or _ws(p), 999)
-        )
-        sort_cols = ["__GroupRank", "__ProcPriority", "__ProcYear", "__ProcNum"]
-        return (
-            items.assign(__GroupRank=ranks, __ProcPriority=priorities, __ProcYear=years, __ProcNum=nums)
-            .sort_values(by=sort_cols, kind="stable")
-            .drop(columns=["__GroupRank", "__ProcPriority", "__ProcYear", "__ProcNum"])
-        )
-    return (
-        items.assign(__GroupRank=ranks, __ProcYear=years, __ProcNum=nums)
-        .sort_values(by=["__GroupRank", "__ProcYear", "__ProcNum"], kind="stable")
-        .drop(columns=["__GroupRank", "__ProcYear", "__ProcNum"])
-    )
+        priorities = [process_priority.get(_normalize_tc_id(_ws(p)) or _ws(p), 999) for p in processos]
+        chaves = list(zip(ranks, priorities, years, nums))
+    else:
+        chaves = list(zip(ranks, years, nums))
+    # sorted e estavel, como o sort_values(kind="stable"); sem montar e descartar colunas auxiliares
+    return items.iloc[sorted(range(len(chaves)), key=chaves.__getitem__)]
+
+
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _expand_initials(value: str) -> str:
     """
     Converte iniciais para nome por extenso:
@@ -757,19 +805,23 @@ def _expand_initials(value: str) -> str:
     s = _ws(value)
     if not s:
         return ""
-    code = re.sub(r"[^A-Za-z]", "", s).upper()
+    code = _NON_ALPHA_RE.sub("", s).upper()
     if 1 <= len(code) <= 3 and code in _NAME_MAP:
         return _NAME_MAP[code]
     return s.upper()
 
 
+_FILENAME_PREFIX_RE = re.compile(r"^(PLENARIO|1CAMARA|2CAMARA|CAMARA1|CAMARA2)_", flags=re.IGNORECASE)
+_UNDERSCORE_WS_RE = re.compile(r"[_\s]+")
+
+
 def _relator_from_filename(path: Path) -> str:
     """Extrai o relator do nome do arquivo exportado pelo e-TCM.
     Ex.: PLENARIO_DOMINGOS_DISSEI.xlsx -> DOMINGOS DISSEI
     """
     stem = path.stem  # ex.: PLENARIO_DOMINGOS_DISSEI
-    stem = re.sub(r"(?i)^(PLENARIO|1CAMARA|2CAMARA|CAMARA1|CAMARA2)_", "", stem)
-    stem = re.sub(r"[_\s]+", " ", stem).strip()
+    stem = _FILENAME_PREFIX_RE.sub("", stem)
+    stem = _UNDERSCORE_WS_RE.sub(" ", stem).strip()
     return _expand_initials(stem)
 
 
@@ -784,6 +836,20 @@ def _competencia_from_filename(path: Path) -> str:
     return ""
 
 
+def _is_reinclusao_series(motivos: pd.Series) -> pd.Series:
+    """Versao vetorizada de _is_reinclusao_text para uma coluna ja normalizada por _ws_series."""
+    t = (
+        motivos.str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace("-", "", regex=False)
+        .str.replace(" ", "", regex=False)
+    )
+    return t.str.contains("reinc", regex=False)
+
+
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _is_reinclusao_text(motivo: str) -> bool:
     """Detecta 'reinclusÃ£o' de forma robusta (ignora acento, hÃ­fen, caixa)."""
     if not motivo:
@@ -793,6 +859,7 @@ def _is_reinclusao_text(motivo: str) -> bool:
     return ("reinclus" in t) or ("reinc" in t)
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _alpha(n: int) -> str:
     """1->A, 2->B, ..., 26->Z, 27->AA ..."""
     s = ""
@@ -838,8 +905,56 @@ def _normalize_competencia(comp: str, relator: str) -> str:
     return "pleno"
 
 
+def _normalize_competencia_series(comps: pd.Series, relatores: pd.Series) -> pd.Series:
+    """Versao vetorizada de _normalize_competencia (uma chamada por valor distinto, nao por linha)."""
+    if comps.empty:
+        return comps
+    chaves = comps.map({c: _strip_accents_lower(_ws(c)) for c in comps.unique()})
+    por_camara = relatores.map(
+        {r: _CAMARA_RELATOR_MAP.get(_strip_accents_lower(_ws(r)), "1c") for r in relatores.unique()}
+    )
+    out = chaves.where(
+        chaves.isin(["1c", "2c", "pleno"]),
+        por_camara.where(chaves.str.contains("camara", regex=False), "pleno"),
+    )
+    return out.map({c: sys.intern(c) for c in out.unique()})
+
+
+# Escape OOXML de caractere (ex.: _x000D_); o calamine decodifica, o openpyxl devolve o texto cru
+_XLSX_ESCAPE_RE = re.compile(rb"_x[0-9A-Fa-f]{4}_")
+
+
+def _xlsx_tem_escapes(path: Path) -> bool:
+    try:
+        with zipfile.ZipFile(path) as z:
+            for nome in z.namelist():
+                if nome == "xl/sharedStrings.xml" or (nome.startswith("xl/worksheets/") and nome.endswith(".xml")):
+                    if _XLSX_ESCAPE_RE.search(z.read(nome)):
+                        return True
+    except (OSError, zipfile.BadZipFile):
+        return True  # deixa o engine padrao reportar o erro
+    return False
+
+
+def _read_excel_str(path: Path) -> pd.DataFrame:
+    """
+    Le a primeira aba como texto: pd.read_excel(path, dtype=str), pelo engine
+    calamine (Rust) quando o python-calamine esta instalado e o formato e suportado.
+    O cabecalho (Unnamed/duplicados) e os valores NA ficam a cargo do proprio pandas.
+    Planilhas com escapes _xHHHH_ seguem pelo openpyxl, que os mantem como texto.
+    """
+    engine = None
+    if python_calamine is not None and path.suffix.lower() in (".xlsx", ".xlsm") and not _xlsx_tem_escapes(path):
+        engine = "calamine"
+    return pd.read_excel(path, dtype=str, engine=engine)
+
+
+# Colunas do DataFrame normalizado devolvido por _ler_planilha/_coletar_planilhas
+_PLANILHA_COLS = ("Relator", "Revisor", "Processo", "Objeto", "Observacao", "Motivo", "IsReinc", "Competencia", "Fonte")
+
+
 def _ler_planilha(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path, dtype=str)
+    df = _read_excel_str(path)
     df.columns = [str(c) for c in df.columns]
     # Garante no mÃ­nimo 10 colunas para atender aos fallbacks (inclui Motivo)
     if len(df.columns) < 10:
@@ -849,41 +964,38 @@ def _ler_planilha(path: Path) -> pd.DataFrame:
 
     proc_idx, obj_idx, relator_idx, revisor_idx, motivo_idx = _detect_cols_basic(df.columns.tolist())
 
-    processos = df.iloc[:, proc_idx].apply(_ws)
-    objetos = df.iloc[:, obj_idx].apply(_ws)
+    processos = _ws_series(df.iloc[:, proc_idx])
+    objetos = _ws_series(df.iloc[:, obj_idx])
     obs_idx = None
     for idx, col in enumerate(df.columns):
         if "observ" in col.lower():
             obs_idx = idx
             break
-    observacoes = df.iloc[:, obs_idx].apply(_ws) if obs_idx is not None else pd.Series([""] * len(df))
+    observacoes = _ws_series(df.iloc[:, obs_idx]) if obs_idx is not None else pd.Series([""] * len(df))
 
     # Detecta competÃªncia por marcadores na primeira coluna (ex.: "CompetÃªncia: PLENO").
-    comp_current = ""
-    competencia_raw: list[str] = []
-    marker_col = df.columns[0] if len(df.columns) > 0 else ""
-    for val in df[marker_col].tolist() if marker_col else []:
-        marker = _competencia_from_marker(val) if isinstance(val, str) else ""
-        if marker:
-            comp_current = marker
-        competencia_raw.append(comp_current)
-    if not competencia_raw:
-        competencia_raw = [""] * len(df)
+    # Cada marcador vale para as linhas seguintes ate o proximo (ffill); um calculo por valor distinto.
+    primeira_col = df.iloc[:, 0].fillna("")
+    marcadores = primeira_col.map({v: _competencia_from_marker(v) for v in primeira_col.unique()})
+    tem_marcador = marcadores.ne("")
+    competencia_raw = marcadores
+    if tem_marcador.any():
+        competencia_raw = marcadores.where(tem_marcador).ffill().where(lambda c: c.notna(), "")
     comp_file = _competencia_from_filename(path)
     if comp_file:
-        competencia_raw = [c if c else comp_file for c in competencia_raw]
+        competencia_raw = competencia_raw.replace("", comp_file)
     # Algumas planilhas trazem o texto apenas na coluna "Assunto" (objeto vazio).
     assunto_alt = None
     for idx, col in enumerate(df.columns):
         if "assunto" in col.lower():
-            assunto_alt = df.iloc[:, idx].apply(_ws)
+            assunto_alt = _ws_series(df.iloc[:, idx])
             break
     if assunto_alt is not None:
         objetos = objetos.where(objetos != "", assunto_alt)
 
     # RELATOR (coluna 7; se vazio, extrai do nome do arquivo)
     if relator_idx is not None and relator_idx < len(df.columns):
-        relatores = df.iloc[:, relator_idx].apply(_expand_initials)
+        relatores = _map_distinct(df.iloc[:, relator_idx], _expand_initials)
         if relatores.fillna("").eq("").all():
             relator_nome_arquivo = _relator_from_filename(path)
             relatores = pd.Series([relator_nome_arquivo] * len(df))
@@ -893,71 +1005,109 @@ def _ler_planilha(path: Path) -> pd.DataFrame:
 
     # REVISOR (coluna 8; se ausente, deixa '-')
     if revisor_idx is not None and revisor_idx < len(df.columns):
-        revisores = df.iloc[:, revisor_idx].apply(_expand_initials)
+        revisores = _map_distinct(df.iloc[:, revisor_idx], _expand_initials)
     else:
         revisores = pd.Series([""] * len(df))
 
     # Completa revisor ausente com base nas duplas definidas
-    def _rev_fallback(rel: str, rev: str) -> str:
-        r = _ws(rev)
-        if r and r != "-":
-            return r
-        key = _strip_accents_lower(_ws(rel))
-        return _DUO_RELATOR_REVISOR.get(key, r)
-
     if not relatores.empty:
-        revisores = pd.Series([
-            _rev_fallback(rel, rev) for rel, rev in zip(relatores.tolist(), revisores.tolist())
-        ])
+        dupla = relatores.map(
+            {rel: _DUO_RELATOR_REVISOR.get(_strip_accents_lower(_ws(rel))) for rel in relatores.unique()}
+        )
+        revisores = revisores.mask(revisores.isin(["", "-"]) & dupla.notna(), dupla)
 
     # MOTIVO (coluna 10) â flag de reinclusÃ£o
     if motivo_idx is not None and motivo_idx < len(df.columns):
-        motivos = df.iloc[:, motivo_idx].apply(_ws)
+        motivos = _ws_series(df.iloc[:, motivo_idx])
     else:
         motivos = pd.Series([""] * len(df))
-    is_reinc = motivos.apply(_is_reinclusao_text)
+    is_reinc = _is_reinclusao_series(motivos)
 
     out = pd.DataFrame(
         {
-            "Relator": relatores.apply(_ws),
-            "Revisor": revisores.apply(lambda s: _ws(s) if _ws(s) else "-"),
-            "Processo": processos.apply(_ws),
-            "Objeto": objetos.apply(_ws),
-            "Observacao": observacoes.apply(_ws),
-            "Motivo": motivos.apply(_ws),
+            "Relator": relatores,
+            "Revisor": revisores.mask(revisores.eq(""), "-"),
+            "Processo": processos,
+            "Objeto": objetos,
+            "Observacao": observacoes,
+            "Motivo": motivos,
             "IsReinc": is_reinc.astype(bool),
-            "Competencia": pd.Series(competencia_raw).apply(_ws),
+            "Competencia": competencia_raw,
         }
     )
 
     # filtra linhas vÃ¡lidas
     out = out[(out["Processo"] != "") & (out["Objeto"] != "")]
-    out["Competencia"] = [
-        _normalize_competencia(comp, rel) for comp, rel in zip(out["Competencia"], out["Relator"])
-    ]
+    out["Competencia"] = _normalize_competencia_series(out["Competencia"], out["Relator"])
+    # Relator/Revisor repetem o mesmo nome em quase todas as linhas: uma unica instancia por valor
+    out["Relator"] = [sys.intern(v) for v in out["Relator"]]
+    out["Revisor"] = [sys.intern(v) for v in out["Revisor"]]
     out["Fonte"] = path.name
     return out
 
 
+# Leitura paralela opcional (TCM_DOCX_WORKERS > 1), so a partir desta quantidade de planilhas;
+# abaixo disso o custo de subir os workers supera o ganho.
+# No Windows os workers sao criados por spawn e reimportam o modulo principal: o script que
+# chama o pipeline precisa do guard `if __name__ == "__main__":` (e de
+# multiprocessing.freeze_support() quando empacotado como executavel).
+_PARALLEL_MIN_PLANILHAS = 8
+
+
+def _leitura_workers(n_arquivos: int) -> int:
+    """Processos para ler as planilhas; 0 = leitura sequencial (padrao)."""
+    try:
+        pedidos = int(_env("TCM_DOCX_WORKERS") or 0)
+    except ValueError:
+        pedidos = 0
+    if pedidos <= 1 or n_arquivos < _PARALLEL_MIN_PLANILHAS:
+        return 0
+    return min(pedidos, n_arquivos)
+
+
+def _ler_planilha_ou_erro(path: Path) -> tuple[pd.DataFrame | None, str | None]:
+    try:
+        return _ler_planilha(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _listar_planilhas(pasta: Path) -> list[Path]:
+    """Planilhas .xlsx/.xls da pasta, ordenadas, numa unica leitura do diretorio."""
+    # normcase: sufixo sem distinguir caixa so onde o glob tambem nao distingue (Windows)
+    try:
+        with os.scandir(pasta) as it:
+            return sorted(
+                Path(e.path) for e in it if os.path.normcase(e.name).endswith((".xlsx", ".xls"))
+            )
+    except OSError:
+        return []
+
+
 def _coletar_planilhas(pasta_planilhas: str | Path) -> pd.DataFrame:
     pasta = Path(pasta_planilhas)
-    arquivos = sorted([*pasta.glob("*.xlsx"), *pasta.glob("*.xls")])
-    frames = []
-    for arq in arquivos:
+    arquivos = _listar_planilhas(pasta)
+    resultados = None
+    workers = _leitura_workers(len(arquivos))
+    if workers:
         try:
-            frames.append(_ler_planilha(arq))
-        except Exception as e:
-            print(f"[docx] Aviso: falha ao ler {arq.name}: {e}")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                resultados = list(ex.map(_ler_planilha_ou_erro, arquivos))
+        except (OSError, RuntimeError) as e:  # inclui BrokenProcessPool
+            print(f"[docx] Aviso: leitura paralela indisponivel ({e}); lendo em sequencia.")
+    if resultados is None:
+        resultados = [_ler_planilha_ou_erro(arq) for arq in arquivos]
+    frames = []
+    for arq, (frame, erro) in zip(arquivos, resultados):
+        if erro is not None:
+            print(f"[docx] Aviso: falha ao ler {arq.name}: {erro}")
+        else:
+            frames.append(frame)
     if not frames:
-        return pd.DataFrame(
-            columns=["Relator", "Revisor", "Processo", "Objeto", "Observacao", "Motivo", "IsReinc", "Competencia", "Fonte"]
-        )
+        return pd.DataFrame(columns=list(_PLANILHA_COLS))
     full = pd.concat(frames, ignore_index=True)
 
     # Ordena pela sequÃªncia padrÃ£o de relatores e, em seguida, por revisor e processo
-    def _norm_name(n: str) -> str:
-        return _strip_accents_lower(_ws(n))
-
     ordem_relatores = {
         # Ordem padrÃ£o (serÃ¡ substituÃ­da por composiÃ§Ã£o especÃ­fica em gerar_docx_unificado)
         "domingos dissei": 1,
@@ -967,7 +1117,9 @@ def _coletar_planilhas(pasta_planilhas: str | Path) -> pd.DataFrame:
         "eduardo tuma": 5,
     }
 
-    full["_RelatorOrder"] = full["Relator"].map(lambda n: ordem_relatores.get(_norm_name(n), 999))
+    full["_RelatorOrder"] = _map_distinct(
+        full["Relator"], lambda n: ordem_relatores.get(_strip_accents_lower(_ws(n)), 999)
+    )
     full = (
         full
         .sort_values(by=["_RelatorOrder", "Relator", "Revisor"], kind="stable")
@@ -977,6 +1129,12 @@ def _coletar_planilhas(pasta_planilhas: str | Path) -> pd.DataFrame:
     return full
 
 
+@lru_cache(maxsize=4)
+def _template_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """Bytes do template; mtime/tamanho na chave para reler se o arquivo mudar."""
+    return Path(path).read_bytes()
+
+
 def _open_document_from_template(header_template: str | Path | None) -> Document:
     here = Path(__file__).resolve().parent
     cwd = Path.cwd()
@@ -1007,12 +1165,17 @@ def _open_document_from_template(header_template: str | Path | None) -> Document
         push(cwd / n)
         push(here / n)
 
+    # Um scandir por diretorio em vez de exists()/is_file() por candidato
+    listagens: dict[Path, set[str]] = {}
     for p in candidates:
+        if p.parent not in listagens:
+            listagens[p.parent] = list_files(p.parent)
         try:
-            if p.exists() and p.is_file():
+            if os.path.normcase(p.name) in listagens[p.parent]:
                 print(f"[docx] Template candidato: {p}")
-                return Document(str(p))
-        except PackageNotFoundError:
+                st = p.stat()
+                return Document(io.BytesIO(_template_bytes(str(p), st.st_mtime_ns, st.st_size)))
+        except (PackageNotFoundError, zipfile.BadZipFile):
             print(f"[docx] Aviso: '{p}' nÃ£o Ã© um DOCX vÃ¡lido. Tentando prÃ³ximo.")
         except Exception as e:
             print(f"[docx] Aviso: falha ao abrir '{p}': {e}. Tentando prÃ³ximo.")
@@ -1021,7 +1184,7 @@ def _open_document_from_template(header_template: str | Path | None) -> Document
     return Document()
 
 
-def _fontify(run, size=12, small_caps=False, bold=False):
+def _set_font(run, size, small_caps, bold) -> None:
     f = run.font
     f.name = "Arial"
     f.size = Pt(size)
@@ -1029,7 +1192,24 @@ def _fontify(run, size=12, small_caps=False, bold=False):
     f.bold = bool(bold)
 
 
-def _para_fmt(paragraph, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=6, after=6, line=1.15):
+@lru_cache(maxsize=None)
+def _rpr_template(size, small_caps: bool, bold: bool):
+    """<w:rPr> pronto para cada combinacao de fonte usada (montado uma vez pelo python-docx)."""
+    r = OxmlElement("w:r")
+    _set_font(Run(r, None), size, small_caps, bold)
+    return r.rPr
+
+
+def _fontify(run, size=12, small_caps=False, bold=False):
+    r = run._r
+    if r.rPr is not None:
+        _set_font(run, size, small_caps, bold)
+        return
+    # Run recem-criado (sem rPr): copia o modelo em vez de quatro setters do python-docx
+    r.insert(0, deepcopy(_rpr_template(size, bool(small_caps), bool(bold))))
+
+
+def _set_para_fmt(paragraph, align, before, after, line) -> None:
     pf = paragraph.paragraph_format
     paragraph.alignment = align
     pf.space_before = Pt(before)
@@ -1037,19 +1217,48 @@ def _para_fmt(paragraph, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=6, after=6, li
     pf.line_spacing = line
 
 
+@lru_cache(maxsize=None)
+def _ppr_template(align, before, after, line):
+    """<w:pPr> pronto para cada formatacao de paragrafo usada (mesma ideia do _rpr_template)."""
+    p = OxmlElement("w:p")
+    _set_para_fmt(Paragraph(p, None), align, before, after, line)
+    return p.pPr
+
+
+def _para_fmt(paragraph, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=6, after=6, line=1.15):
+    p = paragraph._p
+    if p.pPr is not None:
+        _set_para_fmt(paragraph, align, before, after, line)
+        return
+    p.insert(0, deepcopy(_ppr_template(align, before, after, line)))
+
+
+def _add_run(paragraph, text: str = "") -> Run:
+    """paragraph.add_run(text) sem o automato caractere a caractere do python-docx quando nao ha \t/\r/\n."""
+    if not text or "\t" in text or "\r" in text or "\n" in text:
+        return paragraph.add_run(text)
+    r = paragraph._p.add_r()
+    r.add_t(text)
+    return Run(r, paragraph)
+
+
 def _add_centered(doc: Document, texto: str, bold=False, size=12) -> None:
     p = doc.add_paragraph()
     _para_fmt(p, align=WD_ALIGN_PARAGRAPH.CENTER, before=6, after=6, line=1.15)
-    run = p.add_run(_clean_docx_text(texto))
+    run = _add_run(p, _clean_docx_text(texto))
     _fontify(run, size=size, small_caps=False, bold=bold)
 
 
+def _env(name: str) -> str:
+    # Lido a cada uso: o app.py grava os TCM_META_* em os.environ depois do import.
+    return os.getenv(name, "").strip()
+
+
 def _add_assinatura_final(doc: Document) -> None:
     """Adiciona local/data, nome e cargo no fecho da pauta."""
-    import os
-    nome = os.getenv("TCM_ASSINATURA_NOME", "").strip() or "ROSELI DE MORAIS CHAVES"
-    cargo = os.getenv("TCM_ASSINATURA_CARGO", "").strip() or "Subsecretária-Geral"
-    data_linha = os.getenv("TCM_ASSINATURA_DATA", "").strip()
+    nome = _env("TCM_ASSINATURA_NOME") or "ROSELI DE MORAIS CHAVES"
+    cargo = _env("TCM_ASSINATURA_CARGO") or "Subsecretária-Geral"
+    data_linha = _env("TCM_ASSINATURA_DATA")
     if not data_linha:
         data_linha = f"São Paulo, {_fmt_data_extenso(date.today())}."
 
@@ -1066,13 +1275,13 @@ def _add_item_paragraph(doc: Document, processo: str, objeto: str, idx: int | No
     _para_fmt(p, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=0, after=6, line=1.15)
 
     if idx is not None:
-        r_idx = p.add_run(f"{idx}) ")
+        r_idx = _add_run(p, f"{idx}) ")
         _fontify(r_idx, size=12, bold=True)
 
-    r_proc = p.add_run(_clean_docx_text(_ws(processo)))
+    r_proc = _add_run(p, _clean_docx_text(_ws(processo)))
     _fontify(r_proc, size=12, bold=True)
 
-    r_sep = p.add_run(" - ")
+    r_sep = _add_run(p, " - ")
     _fontify(r_sep, size=12)
 
     objeto_limpo = _clean_docx_text(_ws(objeto))
@@ -1086,35 +1295,43 @@ def _add_item_paragraph(doc: Document, processo: str, objeto: str, idx: int | No
             for i, linha in enumerate(adv_linhas):
                 if i > 0:
                     p.add_run().add_break()
-                r_adv = p.add_run(_clean_docx_text(linha))
+                r_adv = _add_run(p, _clean_docx_text(linha))
                 _fontify(r_adv, size=10, bold=False)
 
 
 def _find_special_spans(texto: str) -> list[tuple[int, int]]:
     spans: list[tuple[int, int]] = []
-    for m in _VOTO_DESEMPATE_PATTERN.finditer(texto):
-        spans.append((m.start(), m.end()))
-    for m in _ITENS_ENGLOBADOS_PATTERN.finditer(texto):
-        spans.append((m.start(), m.end()))
+    # Triagem barata: cada padrao exige uma palavra literal; o casefold cobre todas as
+    # equivalencias de caixa do IGNORECASE (ex.: 'ſ' ~ 's'), entao nada casa sem ela.
+    lo = texto.casefold()
+    if "desempate" in lo:
+        spans.extend(m.span() for m in _VOTO_DESEMPATE_PATTERN.finditer(texto))
+    if "englobados" in lo:
+        spans.extend(m.span() for m in _ITENS_ENGLOBADOS_PATTERN.finditer(texto))
     return spans
 
 
 def _merge_spans(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
     if not spans:
         return []
-    spans = sorted(spans, key=lambda t: t[0])
-    merged = [spans[0]]
-    for s, e in spans[1:]:
-        last_s, last_e = merged[-1]
-        if s <= last_e:
-            merged[-1] = (last_s, max(last_e, e))
+    # Os trechos vem de buscas separadas (keyword principal + padroes especiais), entao a
+    # ordenacao continua necessaria; a uniao e uma varredura so, sem recriar tuplas a cada passo.
+    it = iter(sorted(spans))
+    cur_s, cur_e = next(it)
+    merged = []
+    for s, e in it:
+        if s <= cur_e:
+            if e > cur_e:
+                cur_e = e
         else:
-            merged.append((s, e))
+            merged.append((cur_s, cur_e))
+            cur_s, cur_e = s, e
+    merged.append((cur_s, cur_e))
     return merged
 
 
-def _split_objeto_runs(texto: str) -> list[tuple[str, bool]]:
-    _, _, span = compute_primary_keyword(texto)
+def _split_objeto_runs(texto: str, already_clean: bool = False) -> list[tuple[str, bool]]:
+    _, _, span = compute_primary_keyword(texto, already_clean=already_clean)
     spans: list[tuple[int, int]] = []
     if span:
         spans.append(span)
@@ -1138,17 +1355,21 @@ def _add_obj_with_highlights(paragraph, texto: str) -> None:
     """Renderiza o texto do objeto dividindo em runs e deixando apenas o tipo principal em negrito."""
     texto = _clean_docx_text(texto)
     if not texto:
-        r = paragraph.add_run("")
+        r = _add_run(paragraph, "")
         _fontify(r, size=12)
         return
 
-    for chunk, is_bold in _split_objeto_runs(texto):
+    for chunk, is_bold in _split_objeto_runs(texto, already_clean=True):
         if not chunk:
             continue
-        r = paragraph.add_run(chunk)
+        r = _add_run(paragraph, chunk)
         _fontify(r, size=12, bold=is_bold)
 
 
+_BEFORE_PAREN_RE = re.compile(r"(?=\()")
+_ADVOGADOS_RE = re.compile(r"\(Advog", flags=re.IGNORECASE)
+
+
 def _split_parenthetical_lines(texto: str) -> list[str]:
     """Quebra texto em linhas, iniciando nova linha a cada novo '('."""
     if not texto:
@@ -1156,12 +1377,12 @@ def _split_parenthetical_lines(texto: str) -> list[str]:
     cleaned = _clean_docx_text(texto).strip()
     if not cleaned:
         return []
-    parts = [p.strip() for p in re.split(r"(?=\()", cleaned) if p and p.strip()]
+    parts = [p.strip() for p in _BEFORE_PAREN_RE.split(cleaned) if p and p.strip()]
     return parts or [cleaned]
 
 
 def _split_advogados(texto: str) -> tuple[str, str]:
-    m = re.search(r"\(Advog", texto, flags=re.IGNORECASE)
+    m = _ADVOGADOS_RE.search(texto)
     if not m:
         return texto.strip(), ""
     return texto[:m.start()].strip(), texto[m.start():].strip()
@@ -1177,6 +1398,9 @@ def _format_itens_englobados(itens: list[str], sep: str) -> str:
     return f"(Itens englobados{sep}{' e '.join(str(i) for i in itens)})"
 
 
+_RETIRADO_SONP_RE = re.compile(r"Retirado de Pauta na [^\\.]*Sonp", flags=re.IGNORECASE)
+
+
 def _prepare_objeto_text(
     raw_text: str,
     proc_norm: str,
@@ -1195,12 +1419,7 @@ def _prepare_objeto_text(
     if not retorno_override:
         retorno_override = _infer_retorno_template(observacao, text, relator)
     if overrides.get("retirado"):
-        text = re.sub(
-            r"Retirado de Pauta na [^\\.]*Sonp",
-            overrides["retirado"],
-            text,
-            flags=re.IGNORECASE,
-        )
+        text = _RETIRADO_SONP_RE.sub(overrides["retirado"], text)
 
     group_key = group_map.get(proc_norm)
     if group_key:
@@ -1239,32 +1458,44 @@ def _prepare_objeto_text(
         parts.append(adv)
     out = _ws(" ".join(p for p in parts if p))
     out = normalize_status_lines(out)
-    out = apply_published_exceptions(proc_norm, out)
-    out = apply_final_overrides(proc_norm, out)
+    # O texto ja sai normalizado daqui; as excecoes so alteram algo nos TCs listados
+    if proc_norm in _PUBLISHED_EXCEPTION_PROCS:
+        out = apply_published_exceptions(proc_norm, out)
+    if proc_norm in _FINAL_OVERRIDE_PROCS:
+        out = apply_final_overrides(proc_norm, out)
     out = sanitize_text(out)
     return out
 
 
-def _build_tramitam_group_map(rows: list) -> dict[str, frozenset[str]]:
-    procs = set()
-    for row in rows:
-        norm = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
-        if norm:
-            procs.add(norm)
+def _proc_norm_list(processos: list) -> list[str]:
+    """Processo normalizado (ou o texto cru, se nao for um TC) de cada linha, na ordem."""
+    out = []
+    for processo in processos:
+        raw = _ws(processo)
+        out.append(_normalize_tc_id(raw) or raw)
+    return out
+
 
+def _build_tramitam_group_map(
+    processos: list, objetos: list, procs_norm: list[str] | None = None
+) -> dict[str, frozenset[str]]:
+    if procs_norm is None:
+        procs_norm = _proc_norm_list(processos)
+    procs = set()
     group_map: dict[str, frozenset[str]] = {}
-    for row in rows:
-        proc = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
+    for objeto, proc in zip(objetos, procs_norm):
         if not proc:
             continue
-        group = set(_extract_tramitam_group(_ws(row.Objeto)))
+        procs.add(proc)
+        group = set(_extract_tramitam_group(_ws(objeto)))
         if group:
             group.add(proc)
             key = frozenset(group)
             for p in key:
                 group_map[p] = key
 
-    for key in _CONJUNTO_RULES:
+    candidatas = {key for p in procs for key in _PROC_TO_CONJUNTO_KEYS.get(p, ())}
+    for key in sorted(candidatas, key=_CONJUNTO_ORDER.__getitem__):
         if key.issubset(procs):
             for p in key:
                 group_map[p] = key
@@ -1278,6 +1509,7 @@ _ROMANS = [
 ]
 
 
+@lru_cache(maxsize=_NORM_CACHE_SIZE)
 def _roman(n: int) -> str:
     if n <= 0:
         return str(n)
@@ -1317,7 +1549,7 @@ def _format_relator_label(relator: str, roman_idx: int) -> str:
 # CabeÃ§alhos por tipo de sessÃ£o
 # =========================
 
-@dataclass
+@dataclass(slots=True)
 class SessionMeta:
     numero: str                 # ex: "71" ou "3.385"
     tipo: str                   # 'ordinaria' | 'extraordinaria'
@@ -1366,15 +1598,18 @@ class SessionMeta:
                 elif self.formato == "nao-presencial" and self.tipo.startswith("extra"):
                     abertura_calc = _nth_weekday_of_next_month(pub, weekday=1, n=2)  # Tuesday, 2Âª
 
+        # Data de abertura vigente, mantida como date para nao reparsear a string formatada
+        abertura = pub
         if abertura_calc is not None:
+            abertura = abertura_calc
             self.data_abertura = _fmt_date_br(abertura_calc)
         # ForÃ§a de datas finais via env (mantÃ©m compatibilidade)
-        import os
-        ab_forcada = os.getenv("TCM_META_ABERTURA_FINAL", "").strip()
-        en_forcada = os.getenv("TCM_META_ENCERRAMENTO_FINAL", "").strip()
+        ab_forcada = _env("TCM_META_ABERTURA_FINAL")
+        en_forcada = _env("TCM_META_ENCERRAMENTO_FINAL")
         if ab_forcada:
             d = _parse_date_br(ab_forcada)
             if d is not None:
+                abertura = d
                 self.data_abertura = _fmt_date_br(d)
 
         if en_forcada:
@@ -1383,22 +1618,20 @@ class SessionMeta:
                 self.data_encerramento = _fmt_date_br(d)
         elif not self.data_encerramento:
             # Todas as sessÃµes: 15 dias corridos a partir da Abertura
-            base = _parse_date_br(self.data_abertura)
-            if base is not None:
-                self.data_encerramento = _fmt_date_br(base + timedelta(days=15))
+            if abertura is not None:
+                self.data_encerramento = _fmt_date_br(abertura + timedelta(days=15))
             else:
                 self.data_encerramento = ""
 
 
 def _meta_from_env() -> Optional[SessionMeta]:
-    import os
-    tipo = os.getenv("TCM_META_TIPO", "").strip()
-    formato = os.getenv("TCM_META_FORMATO", "").strip()
-    comp = os.getenv("TCM_META_COMPETENCIA", "").strip()
-    num = os.getenv("TCM_META_NUMERO", "").strip()
-    d_ab = os.getenv("TCM_META_DATA_ABERTURA", "").strip()
-    d_en = os.getenv("TCM_META_DATA_ENCERRAMENTO", "").strip()
-    hr = os.getenv("TCM_META_HORARIO", "").strip() or "9h30"
+    tipo = _env("TCM_META_TIPO")
+    formato = _env("TCM_META_FORMATO")
+    comp = _env("TCM_META_COMPETENCIA")
+    num = _env("TCM_META_NUMERO")
+    d_ab = _env("TCM_META_DATA_ABERTURA")
+    d_en = _env("TCM_META_DATA_ENCERRAMENTO")
+    hr = _env("TCM_META_HORARIO") or "9h30"
     if not (tipo and formato and comp and num and d_ab):
         return None
     meta = SessionMeta(numero=num, tipo=tipo, formato=formato, competencia=comp,
@@ -1460,7 +1693,7 @@ def _add_intro_from_meta(doc: Document, meta: SessionMeta) -> None:
 
     p = doc.add_paragraph()
     _para_fmt(p, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=0, after=10, line=1.15)
-    run = p.add_run(_clean_docx_text(rest))
+    run = _add_run(p, _clean_docx_text(rest))
     _fontify(run, size=12)
     _add_centered(doc, "- I -", bold=True, size=12)
     _add_centered(doc, "ORDEM DO DIA", bold=True, size=12)
@@ -1478,7 +1711,7 @@ def _add_intro_padrao(doc: Document, titulo: Optional[str]) -> None:
     )
     p = doc.add_paragraph(_clean_docx_text(intro))
     _para_fmt(p, align=WD_ALIGN_PARAGRAPH.JUSTIFY, before=0, after=8, line=1.15)
-    _fontify(p.runs[0] if p.runs else p.add_run(""), size=12)
+    _fontify(p.runs[0] if p.runs else _add_run(p, ""), size=12)
     _add_centered(doc, "- I -", bold=True, size=12)
     _add_centered(doc, "ORDEM DO DIA", bold=True, size=12)
     doc.add_paragraph("")
@@ -1505,7 +1738,7 @@ _PURPLE = RGBColor(0x80, 0x00, 0x80)
 def _add_competencia_heading(doc: Document, comp: str) -> None:
     p = doc.add_paragraph()
     _para_fmt(p, align=WD_ALIGN_PARAGRAPH.CENTER, before=6, after=6, line=1.15)
-    run = p.add_run(_clean_docx_text(_competencia_label(comp)))
+    run = _add_run(p, _clean_docx_text(_competencia_label(comp)))
     _fontify(run, size=12, bold=True)
     run.font.underline = True
     run.font.color.rgb = _PURPLE
@@ -1562,6 +1795,46 @@ def _process_priority_for_competencia(comp: str) -> dict[str, int]:
     return {}
 
 
+def _save_document(doc: Document, out_path: Path) -> None:
+    # Serializa em memoria e grava num unico write (evita as muitas escritas pequenas do zipfile em disco);
+    # o rename no fim nao deixa um .docx pela metade se a gravacao falhar.
+    buf = io.BytesIO()
+    doc.save(buf)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    try:
+        tmp.write_bytes(buf.getbuffer())
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _iniciar_documento(
+    header_template: str | Path | None, titulo: str | None, meta_sessao: SessionMeta | None
+) -> tuple[Document, SessionMeta | None]:
+    """Abre o template e escreve o cabeÃ§alho contextual (se houver meta) ou o padrÃ£o."""
+    doc = _open_document_from_template(header_template)
+    if meta_sessao is None:
+        # _meta_from_env ja devolve a meta normalizada
+        meta_sessao = _meta_from_env()
+    else:
+        meta_sessao.normalizar()
+    if meta_sessao:
+        _add_intro_from_meta(doc, meta_sessao)
+    else:
+        _add_intro_padrao(doc, titulo)
+    return doc, meta_sessao
+
+
+def _finalizar_documento(doc: Document, saida_docx: str | Path) -> str:
+    """Assina (aplicada a todas as sessÃµes) e grava o DOCX; devolve o caminho gravado."""
+    _add_assinatura_final(doc)
+    out_path = Path(saida_docx)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    _save_document(doc, out_path)
+    return str(out_path)
+
+
 # =========================
 # GeraÃ§Ã£o do DOCX
 # =========================
@@ -1576,17 +1849,7 @@ def gerar_docx_unificado(
     if df.empty:
         raise RuntimeError("Nenhuma planilha vÃ¡lida encontrada para unificaÃ§Ã£o.")
 
-    doc = _open_document_from_template(header_template)
-
-    # CabeÃ§alho contextual (se houver meta) ou padrÃ£o
-    if meta_sessao is None:
-        env_meta = _meta_from_env()
-        meta_sessao = env_meta
-    if meta_sessao:
-        meta_sessao.normalizar()
-        _add_intro_from_meta(doc, meta_sessao)
-    else:
-        _add_intro_padrao(doc, titulo)
+    doc, meta_sessao = _iniciar_documento(header_template, titulo, meta_sessao)
 
     meta_comp = _strip_accents_lower(meta_sessao.competencia) if meta_sessao else ""
     meta_formato = _strip_accents_lower(meta_sessao.formato) if meta_sessao else ""
@@ -1594,9 +1857,9 @@ def gerar_docx_unificado(
     is_pleno_presencial = bool(is_presencial_meta and meta_comp == "pleno")
 
     # Em presencial, renderiza apenas a competencia da sessao (evita blocos de camaras no pleno presencial).
-    competencias_presentes = [
-        comp for comp in ["1c", "2c", "pleno"] if not df[df["Competencia"] == comp].empty
-    ]
+    # Um unico groupby separa as competencias (em vez de uma mascara por competencia)
+    por_competencia = dict(tuple(df.groupby("Competencia", sort=False)))
+    competencias_presentes = [comp for comp in ["1c", "2c", "pleno"] if comp in por_competencia]
     if is_presencial_meta and meta_comp in {"1c", "2c", "pleno"}:
         competencias_render = [meta_comp]
     elif competencias_presentes:
@@ -1604,39 +1867,42 @@ def gerar_docx_unificado(
     else:
         competencias_render = ["1c", "2c", "pleno"]
 
-    # Prioridade fixa de revisores dentro de cada relator
-    # 1) Vice-Presidente Ricardo Torres; 2) Corregedor Roberto Braguim; 3) Jo?o Antonio; 4) Eduardo Tuma; demais depois.
-    rev_order = {
-        "ricardo torres": 1,
-        "roberto braguim": 2,
-        "joao antonio": 3,
-        "eduardo tuma": 4,
-    }
-
-    # Fun??o para rotular o cargo do revisor no t?tulo
-    def _cargo_revisor(nome: str) -> str:
-        k = _strip_accents_lower(_ws(nome))
-        if k == "domingos dissei":
-            return "CONSELHEIRO PRESIDENTE"
-        if k == "ricardo torres":
-            return "CONSELHEIRO VICE-PRESIDENTE"
-        if k == "roberto braguim":
-            return "CONSELHEIRO CORREGEDOR"
-        return "CONSELHEIRO"
-
     def _sort_blocos(df_block: pd.DataFrame, relatores: list[str]) -> pd.DataFrame:
         ordem_map = {name: i + 1 for i, name in enumerate(relatores)}
-        df_block = df_block.copy()
-        df_block["__RelatorOrder"] = df_block["Relator"].map(
-            lambda n: ordem_map.get(_norm_relator_key(n), 999)
-        )
-        df_block["__RevisorOrder"] = df_block["Revisor"].map(lambda n: rev_order.get(_strip_accents_lower(_ws(n)), 999))
+        # Ordem calculada uma vez por nome distinto; o assign evita copiar o bloco antes de ordenar
         return (
-            df_block.sort_values(by=["__RelatorOrder", "Relator", "__RevisorOrder", "Revisor"], kind="stable")
+            df_block.assign(
+                __RelatorOrder=_map_distinct(df_block["Relator"], lambda n: ordem_map.get(_norm_relator_key(n), 999)),
+                __RevisorOrder=_map_distinct(
+                    df_block["Revisor"], lambda n: _REVISOR_ORDEM.get(_strip_accents_lower(_ws(n)), 999)
+                ),
+            )
+            # IsReinc como primeira chave deixa os itens de reinclusao contiguos ao final do bloco
+            .sort_values(by=["IsReinc", "__RelatorOrder", "Relator", "__RevisorOrder", "Revisor"], kind="stable")
             .reset_index(drop=True)
             .drop(columns=["__RelatorOrder", "__RevisorOrder"])
         )
 
+    def _render_itens(bloco: pd.DataFrame) -> None:
+        # Colunas extraidas uma vez como listas (itertuples monta uma namedtuple por linha)
+        processos = bloco["Processo"].tolist()
+        objetos = bloco["Objeto"].tolist()
+        # Normaliza cada processo uma vez e reaproveita na posicao, no agrupamento e na renderizacao
+        procs_norm = _proc_norm_list(processos)
+        pos_map = {proc: i for i, proc in enumerate(procs_norm, start=1) if proc}
+        group_map = _build_tramitam_group_map(processos, objetos, procs_norm)
+        linhas = zip(processos, objetos, procs_norm, bloco["Observacao"].tolist(), bloco["Relator"].tolist())
+        for i, (processo, objeto, proc_norm, observacao, relator) in enumerate(linhas, start=1):
+            obj_text = _prepare_objeto_text(
+                objeto,
+                proc_norm,
+                pos_map,
+                group_map,
+                observacao=_ws(observacao),
+                relator=_ws(relator),
+            )
+            _add_item_paragraph(doc, processo, obj_text, idx=i)
+
     def _render_relatores(
         df_block: pd.DataFrame,
         relatores: list[str],
@@ -1646,9 +1912,12 @@ def gerar_docx_unificado(
     ) -> None:
         roman_counter = 1
         prioridade = _process_priority_for_competencia(competencia)
+        # Um unico groupby pela chave normalizada (em vez de refiltrar o bloco inteiro por relator)
+        blocos = dict(tuple(df_block.groupby(_relator_keys(df_block["Relator"]), sort=False)))
+        vazio = df_block.iloc[:0]
         for relator in relatores:
             rel_key = _norm_relator_key(relator)
-            bloco_relator = df_block[df_block["Relator"].map(_norm_relator_key) == rel_key]
+            bloco_relator = blocos.get(rel_key, vazio)
             # Regra solicitada: no pleno presencial, nao listar Domingos quando estiver sem processos.
             if (
                 is_pleno_presencial
@@ -1668,37 +1937,20 @@ def gerar_docx_unificado(
 
             p_rel = doc.add_paragraph()
             _para_fmt(p_rel, align=WD_ALIGN_PARAGRAPH.LEFT, before=8, after=6, line=1.0)
-            run_rel = p_rel.add_run(_clean_docx_text(rotulo_relator))
+            run_rel = _add_run(p_rel, _clean_docx_text(rotulo_relator))
             _fontify(run_rel, size=12, bold=True)
 
             if bloco_relator.empty:
                 p_sem = doc.add_paragraph()
                 _para_fmt(p_sem, align=WD_ALIGN_PARAGRAPH.LEFT, before=0, after=6, line=1.0)
-                run_sem = p_sem.add_run("(Sem processos para relatar)")
+                run_sem = _add_run(p_sem, "(Sem processos para relatar)")
                 _fontify(run_sem, size=12)
                 doc.add_paragraph("")
                 continue
 
             if competencia == "1c":
                 bloco_relator = sort_items_for_segment(bloco_relator, process_priority=prioridade)
-                rows = list(bloco_relator.itertuples(index=False))
-                pos_map: dict[str, int] = {}
-                for i, row in enumerate(rows, start=1):
-                    proc_norm = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
-                    if proc_norm:
-                        pos_map[proc_norm] = i
-                group_map = _build_tramitam_group_map(rows)
-                for i, row in enumerate(rows, start=1):
-                    proc_norm = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
-                    obj_text = _prepare_objeto_text(
-                        row.Objeto,
-                        proc_norm or _ws(row.Processo),
-                        pos_map,
-                        group_map,
-                        observacao=_ws(row.Observacao),
-                        relator=_ws(row.Relator),
-                    )
-                    _add_item_paragraph(doc, row.Processo, obj_text, idx=i)
+                _render_itens(bloco_relator)
                 doc.add_paragraph("")
                 continue
 
@@ -1709,36 +1961,19 @@ def gerar_docx_unificado(
                 prefix = f"{_alpha(idx)} - " if multi else ""
                 subt = doc.add_paragraph()
                 _para_fmt(subt, align=WD_ALIGN_PARAGRAPH.LEFT, before=4, after=2, line=1.0)
-                cargo_rev = _cargo_revisor(revisor)
+                cargo_rev = _cargo_conselheiro(revisor)
                 rev_label = "REVISOR DESIGNADO" if competencia == "pleno" else "REVISOR"
-                run_sub = subt.add_run(_clean_docx_text(f"{prefix}{rev_label} {cargo_rev} {revisor}"))
+                run_sub = _add_run(subt, _clean_docx_text(f"{prefix}{rev_label} {cargo_rev} {revisor}"))
                 _fontify(run_sub, size=12, bold=True)
 
-                rows = list(bloco_revisor.itertuples(index=False))
-                pos_map: dict[str, int] = {}
-                for i, row in enumerate(rows, start=1):
-                    proc_norm = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
-                    if proc_norm:
-                        pos_map[proc_norm] = i
-                group_map = _build_tramitam_group_map(rows)
-                for i, row in enumerate(rows, start=1):
-                    proc_norm = _normalize_tc_id(_ws(row.Processo)) or _ws(row.Processo)
-                    obj_text = _prepare_objeto_text(
-                        row.Objeto,
-                        proc_norm or _ws(row.Processo),
-                        pos_map,
-                        group_map,
-                        observacao=_ws(row.Observacao),
-                        relator=_ws(row.Relator),
-                    )
-                    _add_item_paragraph(doc, row.Processo, obj_text, idx=i)
+                _render_itens(bloco_revisor)
 
                 doc.add_paragraph("")
 
             doc.add_paragraph("")
 
     for competencia in competencias_render:
-        df_comp = df[df["Competencia"] == competencia]
+        df_comp = por_competencia.get(competencia, df.iloc[:0])
         relatores = _relatores_para_render(competencia, df_comp)
         df_comp = _sort_blocos(df_comp, relatores)
 
@@ -1748,26 +1983,22 @@ def gerar_docx_unificado(
         if presidente:
             p_pres = doc.add_paragraph()
             _para_fmt(p_pres, align=WD_ALIGN_PARAGRAPH.LEFT, before=4, after=4, line=1.0)
-            run_pres = p_pres.add_run(_clean_docx_text(presidente))
+            run_pres = _add_run(p_pres, _clean_docx_text(presidente))
             _fontify(run_pres, size=12, bold=True)
             doc.add_paragraph("")
 
-        df_main = df_comp[df_comp["IsReinc"] == False]
+        # Bloco ja ordenado por IsReinc: as duas partes sao fatias (sem mascara nem copia)
+        k = int(df_comp["IsReinc"].to_numpy(dtype=bool).searchsorted(True))
+        df_main = df_comp.iloc[:k]
         _render_relatores(df_main, relatores, use_roman=True, competencia=competencia, show_empty=True)
 
-        df_reinc = df_comp[df_comp["IsReinc"] == True]
+        df_reinc = df_comp.iloc[k:]
         if not df_reinc.empty:
             _add_centered(doc, "PROCESSOS DE REINCLUSÃO", bold=True, size=12)
             doc.add_paragraph("")
             _render_relatores(df_reinc, relatores, use_roman=False, competencia=competencia, show_empty=False)
 
-    # Assinatura ao final (aplicada a todas as sessÃµes)
-    _add_assinatura_final(doc)
-
-    out_path = Path(saida_docx)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(out_path))
-    return str(out_path)
+    return _finalizar_documento(doc, saida_docx)
 
 
 def gerar_docx_vazio(
@@ -1778,21 +2009,7 @@ def gerar_docx_vazio(
     meta_sessao: SessionMeta | None = None,
 ) -> str:
     """Gera um DOCX apenas com cabeÃ§alho (meta ou padrÃ£o), sem itens."""
-    doc = _open_document_from_template(header_template)
-    if meta_sessao is None:
-        env_meta = _meta_from_env()
-        meta_sessao = env_meta
-    if meta_sessao:
-        meta_sessao.normalizar()
-        _add_intro_from_meta(doc, meta_sessao)
-    else:
-        _add_intro_padrao(doc, titulo)
+    doc, meta_sessao = _iniciar_documento(header_template, titulo, meta_sessao)
     # IndicaÃ§Ã£o opcional de ausÃªncia de itens
     _add_centered(doc, "(Sem itens)", bold=False, size=11)
-    # Assinatura ao final (aplicada a todas as sessÃµes)
-    _add_assinatura_final(doc)
-
-    out_path = Path(saida_docx)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(out_path))
-    return str(out_path)
+    return _finalizar_documento(doc, saida_docx)
@@ -376,14 +376,16 @@ def send_pauta_unificada(
     account_hint: Optional[str] = None,
     verbose: bool = False,
     force_sync: bool = False,
+    outlook: Tuple[object, object] | None = None,
 ) -> SendResult:
     """
     Cria o e-mail no Outlook com o DOCX anexado e:
       - preview=True  -> abre janela (você clica Enviar)
       - save_to_drafts=True -> salva em Rascunhos
       - padrão -> envia imediatamente via Outlook
+    `outlook` permite reutilizar um par (app, ns) já obtido por _get_app_ns().
     """
-    app, ns = _get_app_ns()
+    app, ns = outlook or _get_app_ns()
 
     attach_in = Path(docx_path) if docx_path else _latest_docx(output_dir)
     attach_abs = _resolve_attachment_path(attach_in, verbose=verbose)
@@ -604,3 +606,13 @@ def send_pauta_unificada(
         recipient_status=recipient_statuses,
         log_path=str(log_path) if log_path else None,
     )
+
+
+def send_pauta_unificada_lote(envios: List[dict], **comum) -> List[SendResult]:
+    """
+    Envia a pauta para vários grupos de destinatários com uma única instância do Outlook
+    (o Dispatch COM é feito uma vez, não a cada e-mail).
+    Cada item de `envios` sobrescreve os parâmetros de `comum` (ex.: to, cc, bcc, subject, body).
+    """
+    outlook = _get_app_ns()
+    return [send_pauta_unificada(**{**comum, **envio}, outlook=outlook) for envio in envios]
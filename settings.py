@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+import re
 from typing import Iterable
 
-from dotenv import load_dotenv
-
 
 class ConfigError(RuntimeError):
     pass
@@ -14,8 +13,58 @@ class ConfigError(RuntimeError):
 OUTPUT_DIR_PLANILHAS = r"C:\Users\20386\pautaeletronica\planilhas_74_2026"
 
 
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+_INLINE_COMMENT_RE = re.compile(r"\s+#.*")
+
+
+def _parse_simple_env(lines: list[str]) -> dict[str, str] | None:
+    """
+    Le linhas KEY=VALUE simples (comentarios, `export`, aspas sem escapes).
+    Retorna None se o arquivo usar recursos que exigem o python-dotenv
+    (interpolacao ${VAR}, escapes, valores multilinha ou texto apos as aspas).
+    """
+    values: dict[str, str] = {}
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        value = value.strip()
+        if value[:1] in ("'", '"'):
+            quote = value[0]
+            end = value.find(quote, 1)
+            resto = value[end + 1:].lstrip() if end >= 0 else ""
+            if end < 0 or "\\" in value[:end] or (resto and not resto.startswith("#")):
+                return None
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT_RE.sub("", value).rstrip()
+        if "${" in value:
+            return None
+        values[key] = value
+    return values
+
+
 def load_env() -> None:
-    load_dotenv()
+    """Carrega o .env do projeto sem sobrescrever variaveis ja definidas."""
+    try:
+        with open(_ENV_FILE, "r", encoding="utf-8-sig") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return
+    values = _parse_simple_env(lines)
+    if values is None:
+        from dotenv import load_dotenv
+
+        load_dotenv(_ENV_FILE)
+        return
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
 
 
 def env(name: str, default: str | None = None) -> str | None:
@@ -25,6 +74,22 @@ def env(name: str, default: str | None = None) -> str | None:
     return val
 
 
+def list_files(directory: str | os.PathLike) -> set[str]:
+    """Nomes (normcase) dos arquivos do diretorio numa unica leitura; vazio se nao existir."""
+    names: set[str] = set()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        names.add(os.path.normcase(entry.name))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return names
+
+
 def require_env(name: str) -> str:
     val = env(name)
     if not val:
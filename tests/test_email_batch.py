@@ -0,0 +1,123 @@
+import importlib
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import app
+from app import _read_email_batch
+
+
+def _importar_email_outlook(win32):
+    # email_outlook exige o pywin32 no import; um modulo falso basta para os testes
+    win32com = types.ModuleType("win32com")
+    win32com.client = win32
+    with mock.patch.dict(sys.modules, {"win32com": win32com, "win32com.client": win32}):
+        sys.modules.pop("email_outlook", None)
+        try:
+            return importlib.import_module("email_outlook")
+        finally:
+            sys.modules.pop("email_outlook", None)
+
+
+class TestReadEmailBatch(unittest.TestCase):
+    def _csv(self, conteudo: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(conteudo)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_colunas_ausentes(self) -> None:
+        envios = _read_email_batch(self._csv("to,subject\na@tcm.sp.gov.br,Assunto\n"))
+        self.assertEqual(envios, [{"to": "a@tcm.sp.gov.br", "subject": "Assunto"}])
+
+    def test_sem_coluna_to(self) -> None:
+        for conteudo in ["cc,subject\nc@tcm.sp.gov.br,Assunto\n", "To,cc\na@tcm.sp.gov.br,\n", ""]:
+            with self.assertRaises(ValueError, msg=conteudo):
+                _read_email_batch(self._csv(conteudo))
+
+    def test_linhas_vazias_e_sem_destinatario(self) -> None:
+        conteudo = "to,cc,bcc,subject,body\n\n , c@tcm.sp.gov.br,,,\n,,,,\nb@tcm.sp.gov.br,,,,\n"
+        self.assertEqual(_read_email_batch(self._csv(conteudo)), [{"to": "b@tcm.sp.gov.br"}])
+
+    def test_varios_enderecos_por_campo(self) -> None:
+        conteudo = 'to,cc\n" a@tcm.sp.gov.br; b@tcm.sp.gov.br ","c@tcm.sp.gov.br, d@tcm.sp.gov.br"\n'
+        self.assertEqual(
+            _read_email_batch(self._csv(conteudo)),
+            [{"to": "a@tcm.sp.gov.br; b@tcm.sp.gov.br", "cc": "c@tcm.sp.gov.br, d@tcm.sp.gov.br"}],
+        )
+
+    def test_bom_utf8(self) -> None:
+        self.assertEqual(_read_email_batch(self._csv("\ufeffto\na@tcm.sp.gov.br\n")), [{"to": "a@tcm.sp.gov.br"}])
+
+
+class TestMainEmailBatch(unittest.TestCase):
+    def _rodar_main(self, conteudo: str) -> tuple[str, mock.MagicMock, mock.MagicMock]:
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(conteudo)
+        self.addCleanup(os.remove, path)
+
+        email_outlook = types.ModuleType("email_outlook")
+        email_outlook.send_pauta_unificada = mock.MagicMock()
+        email_outlook.send_pauta_unificada_lote = mock.MagicMock()
+        main_mod = types.ModuleType("main")
+        main_mod.run_pipeline = mock.MagicMock()
+        ambiente = {"ETCM_USERNAME": "usuario", "ETCM_PASSWORD": "senha", "TCM_EMAIL_TO": "padrao@tcm.sp.gov.br"}
+        argv = ["app.py", "--send-email", "--email-batch", path]
+        with mock.patch.dict(os.environ, ambiente), mock.patch.object(sys, "argv", argv), \
+                mock.patch.object(app, "load_env"), \
+                mock.patch.dict(sys.modules, {"email_outlook": email_outlook, "main": main_mod}):
+            with self.assertRaises(SystemExit) as ctx:
+                app.main()
+        return str(ctx.exception.code), email_outlook, main_mod
+
+    def test_lote_so_com_cabecalho_nao_envia(self) -> None:
+        for conteudo in ["to,cc,subject\n", "to,cc\n ,c@tcm.sp.gov.br\n"]:
+            msg, email_outlook, main_mod = self._rodar_main(conteudo)
+            self.assertEqual(msg, "--email-batch sem linhas com destinatario 'to'")
+            email_outlook.send_pauta_unificada.assert_not_called()
+            email_outlook.send_pauta_unificada_lote.assert_not_called()
+            main_mod.run_pipeline.assert_not_called()
+
+    def test_lote_sem_coluna_to_nao_envia(self) -> None:
+        msg, email_outlook, main_mod = self._rodar_main("email\na@tcm.sp.gov.br\n")
+        self.assertIn("Falha ao ler --email-batch", msg)
+        email_outlook.send_pauta_unificada.assert_not_called()
+        main_mod.run_pipeline.assert_not_called()
+
+
+class TestSendPautaUnificadaLote(unittest.TestCase):
+    def test_repassa_parametros_com_um_unico_outlook(self) -> None:
+        win32 = mock.MagicMock()
+        app = win32.gencache.EnsureDispatch.return_value
+        ns = app.GetNamespace.return_value
+        email_outlook = _importar_email_outlook(win32)
+
+        envios = [{"to": "a@tcm.sp.gov.br", "subject": "Pleno"}, {"to": "b@tcm.sp.gov.br", "cc": "c@tcm.sp.gov.br"}]
+        comum = {"output_dir": "output", "to": "padrao@tcm.sp.gov.br", "cc": None, "subject": "Pauta", "preview": True}
+        with mock.patch.object(email_outlook, "send_pauta_unificada", side_effect=["r1", "r2"]) as send:
+            results = email_outlook.send_pauta_unificada_lote(envios, **comum)
+
+        self.assertEqual(results, ["r1", "r2"])
+        win32.gencache.EnsureDispatch.assert_called_once_with("Outlook.Application")
+        self.assertEqual(
+            send.call_args_list,
+            [
+                mock.call(
+                    output_dir="output", to="a@tcm.sp.gov.br", cc=None, subject="Pleno", preview=True,
+                    outlook=(app, ns),
+                ),
+                mock.call(
+                    output_dir="output", to="b@tcm.sp.gov.br", cc="c@tcm.sp.gov.br", subject="Pauta",
+                    preview=True, outlook=(app, ns),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+from docx_maker import _ler_planilha, _read_excel_str
+
+
+def _salvar_planilha(pasta: str, linhas: list[list], nome: str = "planilha.xlsx") -> Path:
+    wb = Workbook()
+    ws = wb.active
+    for linha in linhas:
+        ws.append(linha)
+    path = Path(pasta) / nome
+    wb.save(path)
+    return path
+
+
+class TestLeituraPlanilha(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.pasta = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def assert_igual_ao_pandas(self, path: Path) -> None:
+        esperado = pd.read_excel(path, dtype=str, engine="openpyxl")
+        pd.testing.assert_frame_equal(_read_excel_str(path), esperado)
+
+    def test_valores_na_como_no_pandas(self) -> None:
+        valores = ["N/A", "NA", "None", "null", "n/a", "NULL", "nan", "<NA>", "", "  ", "texto", 1.0, 2.5]
+        path = _salvar_planilha(self.pasta, [["Processo", "Revisor"]] + [[f"TC {i}", v] for i, v in enumerate(valores)])
+        self.assert_igual_ao_pandas(path)
+
+    def test_cabecalhos_duplicados_como_no_pandas(self) -> None:
+        path = _salvar_planilha(self.pasta, [["A", "A", "A.1", None, "A"], ["1", "2", "3", "4", "5"]])
+        self.assert_igual_ao_pandas(path)
+        self.assertEqual(_read_excel_str(path).columns.tolist(), ["A", "A.2", "A.1", "Unnamed: 3", "A.3"])
+
+    def test_escapes_e_erros_como_no_openpyxl(self) -> None:
+        linhas = [["Processo", "Objeto", "Assunto"]]
+        for i, objeto in enumerate(["_x000D_", "Recurso_x000D_ ordinario", "_x005F_x000D_", "#N/A", "a\nb"]):
+            linhas.append([f"TC/00000{i}/2024", objeto, "Assunto alternativo"])
+        path = _salvar_planilha(self.pasta, linhas)
+        self.assert_igual_ao_pandas(path)
+
+        df = _ler_planilha(path)
+        self.assertEqual(
+            df["Objeto"].tolist(),
+            ["_x000D_", "Recurso_x000D_ ordinario", "_x005F_x000D_", "Assunto alternativo", "a b"],
+        )
+
+    def test_revisor_na_usa_dupla_padrao(self) -> None:
+        linhas = [["Processo", "Objeto", "Relator", "Revisor"]]
+        for i, revisor in enumerate(["N/A", "NA", "None", "null", "-"]):
+            linhas.append([f"TC/00000{i}/2024", "Recurso ordinario", "RICARDO TORRES", revisor])
+        df = _ler_planilha(_salvar_planilha(self.pasta, linhas))
+        self.assertEqual(df["Revisor"].tolist(), ["ROBERTO BRAGUIM"] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
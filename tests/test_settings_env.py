@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from dotenv import dotenv_values, load_dotenv
+
+import settings
+from settings import _parse_simple_env, load_env
+
+
+def _dotenv(texto: str) -> dict[str, str]:
+    # load_dotenv ignora chaves sem valor (None); o parser simples tambem
+    valores = dotenv_values(stream=io.StringIO(texto), interpolate=True)
+    return {k: v for k, v in valores.items() if v is not None}
+
+
+class TestParseSimpleEnv(unittest.TestCase):
+    def assert_igual_ao_dotenv(self, texto: str) -> None:
+        valores = _parse_simple_env(texto.splitlines())
+        self.assertIsNotNone(valores, texto)
+        self.assertEqual(valores, _dotenv(texto), texto)
+
+    def test_aspas(self) -> None:
+        for linha in ["A='x y'", 'A="x y"', "A=''", 'A=""', "A='a # b'", 'A="a # b" # c', "A= 'q' ", "A='a'#c"]:
+            self.assert_igual_ao_dotenv(linha)
+
+    def test_export(self) -> None:
+        self.assert_igual_ao_dotenv("export A=1\nexport  B='2'\nexportC=3")
+
+    def test_comentarios(self) -> None:
+        self.assert_igual_ao_dotenv("# comentario\n\nA=valor # comentario\nB=valor#sem-espaco\n  # outro")
+
+    def test_valores_em_branco(self) -> None:
+        self.assert_igual_ao_dotenv("A=\nB= \nC\n  D = espacado  \nE=a=b\nF=a b c")
+
+    def test_recursos_do_dotenv_retornam_none(self) -> None:
+        for linha in ["A=${B}", "A='${B}'", 'A="${B}"', 'A="a\\nb"', "A='sem fim", 'A="x"y']:
+            self.assertIsNone(_parse_simple_env([linha]), linha)
+
+
+class TestLoadEnv(unittest.TestCase):
+    def _carregar(self, texto: str) -> dict[str, str]:
+        with tempfile.TemporaryDirectory() as pasta:
+            path = os.path.join(pasta, ".env")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(texto)
+            with mock.patch.object(settings, "_ENV_FILE", path), mock.patch.dict(os.environ, {}, clear=True):
+                load_env()
+                return dict(os.environ)
+
+    def test_interpolacao_usa_dotenv(self) -> None:
+        texto = "BASE=https://etcm\nURL=${BASE}/pauta\nSENHA='a b'\n"
+        with mock.patch("dotenv.load_dotenv", wraps=load_dotenv) as carregar_dotenv:
+            valores = self._carregar(texto)
+        carregar_dotenv.assert_called_once()
+        self.assertEqual(valores, _dotenv(texto))
+        self.assertEqual(valores["URL"], "https://etcm/pauta")
+
+    def test_sem_interpolacao_nao_usa_dotenv(self) -> None:
+        texto = "export A=1\nB='x # y' # c\n"
+        with mock.patch("dotenv.load_dotenv") as carregar_dotenv:
+            valores = self._carregar(texto)
+        carregar_dotenv.assert_not_called()
+        self.assertEqual(valores, _dotenv(texto))
+
+    def test_nao_sobrescreve_variaveis_existentes(self) -> None:
+        with tempfile.TemporaryDirectory() as pasta:
+            path = os.path.join(pasta, ".env")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("A=do_arquivo\nB=do_arquivo\n")
+            with mock.patch.object(settings, "_ENV_FILE", path), mock.patch.dict(os.environ, {"A": "ja"}, clear=True):
+                load_env()
+                self.assertEqual((os.environ["A"], os.environ["B"]), ("ja", "do_arquivo"))
+
+
+if __name__ == "__main__":
+    unittest.main()